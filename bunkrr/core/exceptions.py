@@ -4,6 +4,9 @@ from typing import Optional, Dict, Any
 class BunkrrError(Exception):
     """Base exception class for bunkrr package."""
     
+    # Whether the failed operation may be retried
+    retriable: bool = False
+    
     def __init__(
         self,
         message: str,
@@ -227,6 +230,8 @@ class ShutdownError(BunkrrError):
 class ParsingError(BunkrrError):
     """Data parsing error."""
     
+    retriable = True
+    
     def __init__(
         self,
         message: str,
@@ -249,6 +254,8 @@ class ParsingError(BunkrrError):
 class RateLimitError(BunkrrError):
     """Rate limit exceeded error."""
     
+    retriable = True
+    
     def __init__(
         self,
         message: str,
@@ -37,6 +37,9 @@ JSON_FORMAT = {
     'duration': '%(duration)s'
 }
 
+# Values json encodes as-is, no serialization probe needed
+_JSON_SCALARS = (str, int, float, bool, type(None))
+
 class StructuredFormatter(logging.Formatter):
     """JSON formatter for structured logging."""
     
@@ -82,6 +85,9 @@ class StructuredFormatter(logging.Formatter):
         extra = {}
         for key, value in record.__dict__.items():
             if key not in logging.LogRecord.__dict__:
+                if isinstance(value, _JSON_SCALARS):
+                    extra[key] = value
+                    continue
                 try:
                     json.dumps(value)  # Test JSON serialization
                     extra[key] = value
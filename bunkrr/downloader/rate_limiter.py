@@ -4,6 +4,7 @@ import time
 from typing import Optional, Deque, Dict
 from collections import deque
 import json
+import logging
 
 from ..core.exceptions import RateLimitError
 from ..core.logger import setup_logger
@@ -24,7 +25,6 @@ class RateLimiter:
         self.bucket_size = requests_per_window
         self.current_tokens = requests_per_window
         self.last_update = time.monotonic()
-        self._lock = asyncio.Lock()
         self._token_queue: Deque[float] = deque()
         self._window_size = window_seconds
         
@@ -62,9 +62,10 @@ class RateLimiter:
             )
         return cleaned
     
-    def _add_tokens(self) -> None:
+    def _add_tokens(self, now: Optional[float] = None) -> None:
         """Add tokens based on time elapsed with optimized calculation."""
-        now = time.monotonic()
+        if now is None:
+            now = time.monotonic()
         time_passed = now - self.last_update
         
         # Skip update if time passed is negligible
@@ -91,61 +92,48 @@ class RateLimiter:
             )
     
     async def acquire(self, tokens: float = 1.0) -> None:
-        """Acquire tokens with optimized waiting strategy."""
+        """Acquire tokens with optimized waiting strategy.
+        
+        The event loop is single-threaded and nothing awaits between the
+        check and the update, so no lock is needed. When tokens are
+        available the call completes without suspending.
+        """
         if not (0 < tokens <= self.bucket_size):
             raise RateLimitError(
                 f"Invalid token request: {tokens} (must be between 0 and {self.bucket_size})"
             )
         
-        start_time = time.monotonic()
+        # One clock read per attempt, shared by window and bucket updates
+        start_time = now = time.monotonic()
         self._stats['total_requests'] += 1
+        total_wait = 0.0
+        cleaned_tokens = 0
         
         try:
-            async with self._lock:
-                now = time.monotonic()
-                cleaned_tokens = self._cleanup_tokens(now)
+            while True:
+                cleaned_tokens += self._cleanup_tokens(now)
+                self._add_tokens(now)
                 
                 # Check if we're within rate limit
                 if len(self._token_queue) >= self.bucket_size:
                     wait_time = self._token_queue[0] + self._window_size - now
-                    if wait_time > 0:
-                        self._stats['rate_limit_hits'] += 1
-                        logger.warning(
-                            "Rate limit exceeded - Waiting: %.2fs, Queue size: %d/%d, "
-                            "Rate limit hits: %d",
-                            wait_time,
-                            len(self._token_queue),
-                            self.bucket_size,
-                            self._stats['rate_limit_hits']
-                        )
-                        await asyncio.sleep(wait_time)
-                        now = time.monotonic()
-                
-                # Add new token timestamp
-                self._token_queue.append(now)
-                
-                # Update token bucket
-                self._add_tokens()
-                
+                    self._stats['rate_limit_hits'] += 1
+                    logger.warning(
+                        "Rate limit exceeded - Waiting: %.2fs, Queue size: %d/%d, "
+                        "Rate limit hits: %d",
+                        wait_time,
+                        len(self._token_queue),
+                        self.bucket_size,
+                        self._stats['rate_limit_hits']
+                    )
+                    
                 # Wait if not enough tokens
-                total_wait = 0.0
-                max_wait_time = tokens / self.rate * 2  # Double the theoretical wait time as safety
-                wait_start = time.monotonic()
-                
-                while self.current_tokens < tokens:
+                elif self.current_tokens < tokens:
                     self._stats['token_shortages'] += 1
                     wait_time = min(
                         (tokens - self.current_tokens) / self.rate,
                         1.0  # Cap individual waits to 1 second
                     )
-                    total_wait += wait_time
-                    
-                    # Check for excessive waiting
-                    if total_wait > max_wait_time:
-                        raise RateLimitError(
-                            f"Maximum wait time exceeded: {total_wait:.2f}s > {max_wait_time:.2f}s"
-                        )
-                    
                     logger.debug(
                         "Token shortage - Waiting: %.2fs, Required: %.2f, Available: %.2f, "
                         "Shortages: %d",
@@ -155,21 +143,28 @@ class RateLimiter:
                         self._stats['token_shortages']
                     )
                     
-                    await asyncio.sleep(wait_time)
-                    self._add_tokens()
-                
-                self.current_tokens -= tokens
+                else:
+                    # Fast path: take the tokens without suspending
+                    self._token_queue.append(now)
+                    self.current_tokens -= tokens
+                    break
                 
-                # Update statistics
-                request_time = time.monotonic() - start_time
-                self._stats['total_wait_time'] += total_wait
-                self._stats['max_wait_time'] = max(
-                    self._stats['max_wait_time'],
-                    request_time
-                )
-                
-                # Log detailed acquisition info
-                logger.info(
+                # Re-check after waking, another task may have taken the tokens
+                total_wait += wait_time
+                await asyncio.sleep(max(wait_time, 0.0))
+                now = time.monotonic()
+            
+            # Update statistics
+            request_time = now - start_time
+            self._stats['total_wait_time'] += total_wait
+            self._stats['max_wait_time'] = max(
+                self._stats['max_wait_time'],
+                request_time
+            )
+            
+            # Log detailed acquisition info (skip serialization unless debugging)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
                     "Token acquisition completed - Stats: %s",
                     json.dumps({
                         'tokens_requested': tokens,
@@ -180,11 +175,11 @@ class RateLimiter:
                         'cleaned_tokens': cleaned_tokens
                     })
                 )
+            
+            # Log statistics periodically
+            if self._stats['total_requests'] % 100 == 0:  # Every 100 requests
+                self._log_statistics()
                 
-                # Log statistics periodically
-                if self._stats['total_requests'] % 100 == 0:  # Every 100 requests
-                    self._log_statistics()
-                    
         except asyncio.CancelledError:
             logger.warning(
                 "Token acquisition cancelled after %.2fs",
@@ -45,6 +45,27 @@ class RequestValidator:
     allowed_paths: List[Pattern] = field(default_factory=list)
     max_depth: int = 3
     
+    # Allowed paths merged into one alternation so a request is one match
+    path_pattern: Optional[Pattern] = field(init=False, default=None)
+    
+    def __post_init__(self):
+        """Combine allowed path patterns that share the same flags."""
+        flags = {p.flags for p in self.allowed_paths}
+        if len(flags) != 1:
+            return
+        # Merging renumbers capture groups, which silently retargets
+        # numeric backreferences; only merge group-free patterns
+        if any(p.groups for p in self.allowed_paths):
+            return
+        try:
+            self.path_pattern = re.compile(
+                '|'.join(f'(?:{p.pattern})' for p in self.allowed_paths),
+                flags.pop()
+            )
+        except re.error:
+            # e.g. global inline flags, which must stay at the pattern start
+            self.path_pattern = None
+    
     @classmethod
     def from_spider(cls, spider: Spider) -> 'RequestValidator':
         """Create validator from spider attributes."""
@@ -70,7 +91,14 @@ class RequestValidator:
                 value=domain
             )
         
-        if self.allowed_paths and not any(p.match(path) for p in self.allowed_paths):
+        if self.path_pattern is not None:
+            path_allowed = self.path_pattern.match(path) is not None
+        else:
+            path_allowed = not self.allowed_paths or any(
+                p.match(path) for p in self.allowed_paths
+            )
+        
+        if not path_allowed:
             raise ValidationError(
                 message="Path not allowed",
                 field="path",
@@ -84,16 +112,19 @@ class RequestValidator:
                 value=depth
             )
 
+@dataclass(slots=True)
+class MiddlewareStats:
+    """Spider middleware counters."""
+    processed: int = 0
+    filtered: int = 0
+    errors: int = 0
+
 class SpiderMiddleware:
     """Spider middleware for request validation and error handling."""
     
     def __init__(self):
         """Initialize middleware."""
-        self.stats: Dict[str, int] = {
-            'processed': 0,
-            'filtered': 0,
-            'errors': 0
-        }
+        self.stats = MiddlewareStats()
         self.validator: Optional[RequestValidator] = None
     
     @classmethod
@@ -118,7 +149,7 @@ class SpiderMiddleware:
     @ErrorHandler.wrap
     def process_spider_input(self, response: Response, spider: Spider) -> None:
         """Process response before passing to spider."""
-        self.stats['processed'] += 1
+        self.stats.processed += 1
     
     @ErrorHandler.wrap
     def process_spider_output(
@@ -138,14 +169,14 @@ class SpiderMiddleware:
                 else:
                     filtered_requests.append(request)
             except ValidationError as e:
-                self.stats['filtered'] += 1
+                self.stats.filtered += 1
                 logger.debug(
                     "Filtered request to %s: %s",
                     request.url,
                     e.message
                 )
             except Exception as e:
-                self.stats['errors'] += 1
+                self.stats.errors += 1
                 logger.error(
                     "Error processing request to %s: %s",
                     request.url,
@@ -162,7 +193,7 @@ class SpiderMiddleware:
         spider: Spider
     ) -> None:
         """Handle spider exceptions."""
-        self.stats['errors'] += 1
+        self.stats.errors += 1
         logger.error(
             "Spider error processing %s: %s",
             response.url,
@@ -1,6 +1,6 @@
 """Spider implementation for extracting media content from Bunkr.site."""
 from collections import Counter, defaultdict, deque
-from datetime import datetime, timedelta
+from datetime import datetime
 from pathlib import Path
 from typing import (
     Any, Callable, Counter as CounterType, Deque, Dict, Generator,
@@ -8,6 +8,7 @@ from typing import (
 )
 from urllib.parse import urljoin, urlparse
 import atexit
+import html
 import json
 import os
 import random
@@ -18,7 +19,9 @@ import time
 import traceback
 import uuid
 
-from bs4 import BeautifulSoup, SoupStrainer
+from lxml import etree
+from lxml.html import HTMLParser
+from parsel.csstranslator import HTMLTranslator
 from scrapy import Spider, Request
 from scrapy.exceptions import CloseSpider, DontCloseSpider, IgnoreRequest
 from scrapy.http import Response
@@ -29,7 +32,7 @@ from twisted.internet.error import ReactorNotRunning
 from ...core.config import DownloadConfig
 from ...core.error_handler import ErrorHandler, ErrorStats, ErrorContext
 from ...core.exceptions import (
-    BunkrrError, ParsingError, RateLimitError, ScrapyError, SpiderError,
+    BunkrrError, ParsingError, ScrapyError, SpiderError,
     HTTPError
 )
 from ...core.logger import setup_logger
@@ -39,6 +42,24 @@ from ...utils.backoff import ExponentialBackoff
 
 logger = setup_logger('bunkrr.scrapy.spiders')
 
+_css_to_xpath = HTMLTranslator().css_to_xpath
+
+# One lxml parser per response encoding, reused across pages
+_HTML_PARSERS: Dict[str, HTMLParser] = {}
+
+def _parse_html(response: Response) -> Optional[etree._Element]:
+    """Parse response body bytes straight into an lxml tree.
+    
+    Skips the decode/re-encode round trip of building a Selector from
+    response.text.
+    """
+    if not response.body:
+        return None
+    parser = _HTML_PARSERS.get(response.encoding)
+    if parser is None:
+        parser = _HTML_PARSERS[response.encoding] = HTMLParser(encoding=response.encoding)
+    return etree.fromstring(response.body, parser=parser)
+
 # Type aliases
 T = TypeVar('T')
 ResponseCallback = Callable[
@@ -112,14 +133,29 @@ class BunkrSpider(Spider):
     _ALBUM_ID_PATTERN = re.compile(r'/a/([a-zA-Z0-9]+)')
     _MEDIA_ID_PATTERN = re.compile(r'/v/([a-zA-Z0-9]+)')
     
-    _ALBUM_STRAINER = SoupStrainer(['meta', 'h1', 'div'], attrs={
-        'property': 'og:title',
-        'class_': ['truncate', 'theItem']
-    })
+    # Selectors compiled once at import and evaluated directly on the lxml
+    # tree, so non-matching nodes are dropped in C
+    _MEDIA_HREF_XPATH = etree.XPath(
+        "//a[contains(@href, '/v/')]/@href",
+        smart_strings=False
+    )
+    _MEDIA_INFO_XPATH = etree.XPath(' | '.join((
+        _css_to_xpath('img.grid-images_box-img'),
+        _css_to_xpath('p.theSize'),
+        _css_to_xpath('span.theDate')
+    )))
     
-    _MEDIA_STRAINER = SoupStrainer(['img', 'p', 'span'], attrs={
-        'class_': ['grid-images_box-img', 'theSize', 'theDate']
-    })
+    # Byte patterns for the fixed media page layout, tried before parsing.
+    # Class names must be whole whitespace-separated tokens, as in CSS.
+    _FAST_IMAGE_PATTERN = re.compile(
+        rb'<img\s(?:[^>]*?\s)?class="(?:[^"]*\s)?grid-images_box-img(?:\s[^"]*)?"[^>]*?\ssrc="([^"]+)"'
+    )
+    _FAST_SIZE_PATTERN = re.compile(
+        rb'<p\s(?:[^>]*?\s)?class="(?:[^"]*\s)?theSize(?:\s[^"]*)?"[^>]*>([^<]*)</p>'
+    )
+    _FAST_DATE_PATTERN = re.compile(
+        rb'<span\s(?:[^>]*?\s)?class="(?:[^"]*\s)?theDate(?:\s[^"]*)?"[^>]*>([^<]*)</span>'
+    )
     
     _USER_AGENTS = [
         'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
@@ -147,8 +183,8 @@ class BunkrSpider(Spider):
         # Circuit breaker
         self._error_counts: Dict[str, int] = defaultdict(int)
         self._error_threshold = 5
-        self._error_window = timedelta(minutes=5)
-        self._last_errors: Dict[str, Deque[datetime]] = defaultdict(lambda: deque(maxlen=10))
+        self._error_window = 300.0  # seconds
+        self._last_errors: Dict[str, Deque[float]] = defaultdict(lambda: deque(maxlen=10))
         
         # Request tracking
         self._request_times: Dict[str, float] = {}
@@ -170,7 +206,7 @@ class BunkrSpider(Spider):
             bool: Whether to retry the request
         """
         error_type = error.__class__.__name__
-        now = datetime.now()
+        now = time.monotonic()
         
         # Update error tracking
         self._last_errors[url].append(now)
@@ -184,13 +220,13 @@ class BunkrSpider(Spider):
         
         if recent_errors >= self._error_threshold:
             logger.warning(
-                "Circuit breaker triggered for %s: %d errors in %s",
+                "Circuit breaker triggered for %s: %d errors in %.0fs",
                 url, recent_errors, self._error_window
             )
             return False
         
         # Check error type
-        if isinstance(error, (RateLimitError, ParsingError)):
+        if getattr(error, 'retriable', False):
             return True
             
         if isinstance(error, HTTPError):
@@ -339,11 +375,8 @@ class BunkrSpider(Spider):
             Request objects for media items
         """
         try:
-            # Parse album metadata
-            soup = BeautifulSoup(response.text, 'lxml', parse_only=self._ALBUM_STRAINER)
-            
             # Extract media URLs
-            media_urls = self._extract_media_urls(soup)
+            media_urls = self._extract_media_urls(response)
             
             # Process each media URL
             for url in media_urls:
@@ -370,11 +403,8 @@ class BunkrSpider(Spider):
             Optional[Dict[str, Any]]: Media metadata if successful
         """
         try:
-            # Parse media metadata
-            soup = BeautifulSoup(response.text, 'lxml', parse_only=self._MEDIA_STRAINER)
-            
             # Extract media information
-            media_info = self._extract_media_info(soup)
+            media_info = self._extract_media_info(response)
             
             if not media_info:
                 raise ParsingError(
@@ -411,61 +441,102 @@ class BunkrSpider(Spider):
             self._handle_error(e, response.url, {'source': 'extract_urls'})
             return []
     
-    def _extract_media_urls(self, soup: BeautifulSoup) -> List[str]:
-        """Extract media URLs from soup with error handling.
+    def _extract_media_urls(self, response: Response) -> List[str]:
+        """Extract media URLs from response with error handling.
+        
+        The page is parsed once by lxml in C without building a Python
+        object per tag.
         
         Args:
-            soup: BeautifulSoup object
+            response: Scrapy Response object
             
         Returns:
             List[str]: List of media URLs
         """
         try:
-            urls = []
-            for link in soup.find_all('a', href=True):
-                href = link['href']
-                if self._MEDIA_ID_PATTERN.search(href):
-                    urls.append(href)
-            return urls
+            root = _parse_html(response)
+            if root is None:
+                return []
+            return [
+                href for href in self._MEDIA_HREF_XPATH(root)
+                if self._MEDIA_ID_PATTERN.search(href)
+            ]
             
         except Exception as e:
             self._handle_error(e, 'unknown', {'source': 'extract_media_urls'})
             return []
     
-    def _extract_media_info(self, soup: BeautifulSoup) -> Optional[Dict[str, Any]]:
-        """Extract media information from soup with error handling.
+    def _extract_media_info(self, response: Response) -> Optional[Dict[str, Any]]:
+        """Extract media information from response with error handling.
         
         Args:
-            soup: BeautifulSoup object
+            response: Scrapy Response object
             
         Returns:
             Optional[Dict[str, Any]]: Media information if successful
         """
+        result = self._result_pool.get()
         try:
-            result = self._result_pool.get()
+            # Regex scan when the page matches the known layout
+            if self._match_media_info(response, result):
+                return result
             
-            # Extract media details
-            img = soup.find('img', class_='grid-images_box-img')
-            if img and img.get('src'):
-                result['url'] = img['src']
-                result['type'] = 'image'
-                
-            size_elem = soup.find('p', class_='theSize')
-            if size_elem:
-                result['size'] = size_elem.text.strip()
-                
-            date_elem = soup.find('span', class_='theDate')
-            if date_elem:
-                result['date'] = date_elem.text.strip()
+            root = _parse_html(response)
+            nodes = self._MEDIA_INFO_XPATH(root) if root is not None else ()
+            
+            # Extract media details in a single pass over the tree; the
+            # first matching element of each kind wins
+            for node in nodes:
+                tag = node.tag
+                if tag == 'img':
+                    src = node.get('src')
+                    if src and 'url' not in result:
+                        result['url'] = src
+                        result['type'] = 'image'
+                elif tag == 'p':
+                    if 'size' not in result:
+                        result['size'] = node.text_content().strip()
+                elif 'date' not in result:
+                    result['date'] = node.text_content().strip()
             
-            return result if result else None
+            if result:
+                return result
             
         except Exception as e:
             self._handle_error(e, 'unknown', {'source': 'extract_media_info'})
-            return None
-        finally:
-            if result:
-                self._result_pool.put(result)
+        
+        # Only unused dictionaries go back to the pool
+        self._result_pool.put(result)
+        return None
+    
+    def _match_media_info(self, response: Response, result: Dict[str, Any]) -> bool:
+        """Fill media information by scanning the raw body.
+        
+        Args:
+            response: Scrapy Response object
+            result: Dictionary to fill
+            
+        Returns:
+            bool: Whether every field matched; nothing is filled otherwise
+        """
+        body = response.body
+        matches = (
+            self._FAST_IMAGE_PATTERN.search(body),
+            self._FAST_SIZE_PATTERN.search(body),
+            self._FAST_DATE_PATTERN.search(body)
+        )
+        if not all(matches):
+            return False
+        
+        src, size, date = (
+            html.unescape(match.group(1).decode(response.encoding, 'replace'))
+            for match in matches
+        )
+        result['url'] = src
+        result['type'] = 'image'
+        result['size'] = size.strip()
+        result['date'] = date.strip()
+        return True
     
     def process_request(self, request: Request, spider: Spider) -> Optional[Request]:
         """Process request with error handling.
@@ -30,6 +30,12 @@ from ..core.logger import setup_logger
 
 logger = setup_logger('bunkrr.progress')
 
+# Stats panel labels never change; build them once instead of per refresh
+_STATS_LABELS = tuple(
+    Text(label, style="stats")
+    for label in ("Files:", "Success Rate:", "Downloaded:", "Elapsed Time:")
+)
+
 @dataclass
 class DownloadStats:
     """Statistics for download progress."""
@@ -122,6 +128,8 @@ class ProgressTracker:
             self.current_album = None
             self.album_items = {}
             self.live = None
+            self._last_layout = None
+            self._layout_failed = False
             self._setup_progress_bars()
             self.initialized = True
             logger.info("Initialized ProgressTracker")
@@ -167,8 +175,10 @@ class ProgressTracker:
         """Start progress tracking."""
         if not self.live:
             self.stats.start_time = datetime.now()
+            # The layout is rebuilt by each auto refresh (4/s), not on
+            # every progress update
             self.live = Live(
-                self._generate_layout(),
+                get_renderable=self._render_layout,
                 console=self.console,
                 refresh_per_second=4,
                 transient=True
@@ -216,9 +226,6 @@ class ProgressTracker:
             total=total_files
         )
         
-        if self.live:
-            self.live.update(self._generate_layout())
-        
         logger.info(
             "Started processing album - Name: %s, Files: %d, Total files: %d",
             album_name,
@@ -288,26 +295,6 @@ class ProgressTracker:
                     self.stats.formatted_downloaded_size
                 )
             
-            # Update display
-            if self.live:
-                try:
-                    self.live.update(self._generate_layout())
-                except Exception as e:
-                    logger.error("Failed to update display: %s", str(e))
-                    # Try to recreate display if update fails
-                    try:
-                        if self.live:
-                            self.live.stop()
-                        self.live = Live(
-                            self._generate_layout(),
-                            console=self.console,
-                            refresh_per_second=4,
-                            transient=True
-                        )
-                        self.live.start()
-                    except Exception as e2:
-                        logger.error("Failed to recreate display: %s", str(e2))
-                    
         except Exception as e:
             logger.error(
                 "Error updating progress - Album: %s, Error: %s",
@@ -316,27 +303,39 @@ class ProgressTracker:
                 exc_info=True
             )
     
+    def _render_layout(self):
+        """Build the layout for a live refresh, keeping the last good one.
+        
+        Runs on rich's refresh thread, so a failure is logged here rather
+        than propagating out of the refresh.
+        """
+        try:
+            self._last_layout = self._generate_layout()
+            self._layout_failed = False
+        except Exception as e:
+            # Log once per failure streak; refreshes run 4 times a second
+            if not self._layout_failed:
+                logger.error("Failed to update display: %s", str(e), exc_info=True)
+                self._layout_failed = True
+            if self._last_layout is None:
+                return Text("")
+        return self._last_layout
+    
     def _generate_layout(self) -> Panel:
         """Generate rich layout with progress and stats."""
         # Create stats table with improved formatting
-        stats_table = Table.grid(padding=1)
-        stats_table.add_row(
-            Text("Files:", style="stats"),
-            Text(f"{self.stats.completed_files}/{self.stats.total_files}", style="stats.value")
-        )
-        stats_table.add_row(
-            Text("Success Rate:", style="stats"),
-            Text(f"{self.stats.success_rate:.1f}%", 
-                 style="summary.success" if self.stats.success_rate > 90 else "summary.error")
-        )
-        stats_table.add_row(
-            Text("Downloaded:", style="stats"),
-            Text(self.stats.formatted_downloaded_size, style="stats.value")
-        )
-        stats_table.add_row(
-            Text("Elapsed Time:", style="stats"),
-            Text(self.stats.formatted_elapsed_time, style="stats.value")
+        stats = self.stats
+        success_rate = stats.success_rate
+        values = (
+            Text(f"{stats.completed_files}/{stats.total_files}", style="stats.value"),
+            Text(f"{success_rate:.1f}%",
+                 style="summary.success" if success_rate > 90 else "summary.error"),
+            Text(stats.formatted_downloaded_size, style="stats.value"),
+            Text(stats.formatted_elapsed_time, style="stats.value")
         )
+        stats_table = Table.grid(padding=1)
+        for label, value in zip(_STATS_LABELS, values):
+            stats_table.add_row(label, value)
         
         # Create layout with improved spacing and alignment
         layout = Table.grid(padding=1)
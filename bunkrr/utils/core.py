@@ -8,11 +8,11 @@ from contextlib import asynccontextmanager
 from dataclasses import dataclass
 from pathlib import Path
 from typing import (
-    Any, AsyncGenerator, Callable, Optional,
+    Any, AsyncGenerator, Awaitable, Callable, Optional,
     Set, TypeVar, Union
 )
 
-from ..core.exceptions import ValidationError
+from ..core.exceptions import BunkrrError, ValidationError
 from ..core.logger import setup_logger
 from .storage import is_valid_path
 
@@ -25,27 +25,34 @@ class CancellationToken:
     
     def __init__(self):
         """Initialize cancellation token."""
-        self._cancelled = False
+        self._event = asyncio.Event()
         self._callbacks: Set[Callable[[], None]] = set()
     
     def cancel(self) -> None:
         """Cancel the operation."""
-        if not self._cancelled:
-            self._cancelled = True
-            for callback in self._callbacks:
-                try:
-                    callback()
-                except Exception as e:
-                    logger.error("Cancellation callback error: %s", str(e))
+        if self._event.is_set():
+            return
+        self._event.set()
+        # Callbacks fire once; drop them so they don't outlive the token
+        callbacks, self._callbacks = self._callbacks, set()
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception as e:
+                logger.error("Cancellation callback error: %s", str(e))
     
     @property
     def is_cancelled(self) -> bool:
         """Check if operation is cancelled."""
-        return self._cancelled
+        return self._event.is_set()
+    
+    async def wait(self) -> None:
+        """Wait until the token is cancelled."""
+        await self._event.wait()
     
     def add_callback(self, callback: Callable[[], None]) -> None:
         """Add cancellation callback."""
-        if not self._cancelled:
+        if not self._event.is_set():
             self._callbacks.add(callback)
     
     def remove_callback(self, callback: Callable[[], None]) -> None:
@@ -191,23 +198,67 @@ def validate_config(
     )
     validator.validate(value)
 
+# Shared pool so executor calls reuse worker threads instead of spawning new ones
+_executor: Optional[ThreadPoolExecutor] = None
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Get shared thread pool executor, creating it on first use."""
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(thread_name_prefix='bunkrr')
+    return _executor
+
 @asynccontextmanager
 async def run_in_executor(
     func: Callable[..., T],
     *args: Any,
     **kwargs: Any
 ) -> AsyncGenerator[T, None]:
-    """Run function in thread pool executor."""
-    loop = asyncio.get_event_loop()
-    with ThreadPoolExecutor() as pool:
-        try:
-            result = await loop.run_in_executor(
-                pool,
-                functools.partial(func, *args, **kwargs)
-            )
-            yield result
-        finally:
-            pool.shutdown(wait=True)
+    """Run function in shared thread pool executor."""
+    loop = asyncio.get_running_loop()
+    result = await loop.run_in_executor(
+        _get_executor(),
+        functools.partial(func, *args, **kwargs)
+    )
+    yield result
+
+async def wait_for_with_token(
+    func: Callable[[], Awaitable[T]],
+    timeout: Optional[float] = None,
+    cancellation_token: Optional[CancellationToken] = None
+) -> T:
+    """Await func() with a timeout, aborting early if the token is cancelled."""
+    if cancellation_token is not None and cancellation_token.is_cancelled:
+        raise BunkrrError("Operation cancelled")
+    
+    task = asyncio.ensure_future(func())
+    # Token cancellation cancels the task directly; no watcher task needed.
+    # Kept in a local so the finally block removes the same callback.
+    on_cancel = task.cancel
+    if cancellation_token is not None:
+        cancellation_token.add_callback(on_cancel)
+    
+    try:
+        async with asyncio.timeout(timeout):
+            return await task
+    except TimeoutError as e:
+        raise BunkrrError(
+            "Operation timeout",
+            details=f"Timed out after {timeout} seconds"
+        ) from e
+    except asyncio.CancelledError:
+        # Only translate cancellation that came from the token
+        current = asyncio.current_task()
+        if (
+            cancellation_token is not None
+            and cancellation_token.is_cancelled
+            and not (current and current.cancelling())
+        ):
+            raise BunkrrError("Operation cancelled") from None
+        raise
+    finally:
+        if cancellation_token is not None:
+            cancellation_token.remove_callback(on_cancel)
 
 def handle_signals(handler: Callable[[int, Optional[Any]], None]) -> None:
     """Set up signal handlers for graceful shutdown."""
@@ -1,13 +1,15 @@
 """Data utilities for the bunkrr package."""
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple, Union
+from functools import lru_cache
+from typing import Dict, Optional, Tuple, Union
 import json
 import logging
-import math
 import mimetypes
+import operator
+import os
 import time
-from collections import deque
+from collections import Counter, deque
 
 from rich.console import Console
 from rich.progress import (
@@ -24,7 +26,14 @@ from ..core.logger import setup_logger
 
 logger = setup_logger('bunkrr.data')
 
-@dataclass
+# Fields reported by DownloadStats.to_dict, read in one attrgetter call
+_STATS_FIELDS = (
+    'total', 'completed', 'failed', 'skipped', 'bytes_downloaded',
+    'elapsed_time', 'success_rate', 'average_speed', 'errors'
+)
+_get_stats_fields = operator.attrgetter(*_STATS_FIELDS)
+
+@dataclass(slots=True)
 class DownloadStats:
     """Statistics for download operations."""
     
@@ -35,7 +44,7 @@ class DownloadStats:
     bytes_downloaded: int = 0
     start_time: Optional[float] = None
     end_time: Optional[float] = None
-    errors: Dict[str, int] = field(default_factory=dict)
+    errors: Counter[str] = field(default_factory=Counter)
     
     def start(self) -> None:
         """Start tracking time."""
@@ -76,21 +85,13 @@ class DownloadStats:
     
     def add_error(self, error: str) -> None:
         """Add error occurrence."""
-        self.errors[error] = self.errors.get(error, 0) + 1
+        self.errors[error] += 1
     
     def to_dict(self) -> Dict:
         """Convert stats to dictionary."""
-        return {
-            'total': self.total,
-            'completed': self.completed,
-            'failed': self.failed,
-            'skipped': self.skipped,
-            'bytes_downloaded': self.bytes_downloaded,
-            'elapsed_time': self.elapsed_time,
-            'success_rate': self.success_rate,
-            'average_speed': self.average_speed,
-            'errors': dict(self.errors)
-        }
+        stats = dict(zip(_STATS_FIELDS, _get_stats_fields(self)))
+        stats['errors'] = dict(stats['errors'])
+        return stats
 
 class RateTracker:
     """Track rate of operations over time with enhanced monitoring."""
@@ -98,8 +99,9 @@ class RateTracker:
     def __init__(self, window_size: int = 60):
         """Initialize rate tracker with window size in seconds."""
         self.window_size = window_size
-        self._events: List[Tuple[float, int]] = []
-        self._wait_times: List[Tuple[float, float]] = []  # (timestamp, wait_time)
+        self._events: deque[Tuple[float, int]] = deque()
+        self._event_total = 0  # Running sum of counts in _events
+        self._wait_times: deque[Tuple[float, float]] = deque()  # (timestamp, wait_time)
         self._rate_limit_hits = 0
         self._last_cleanup = time.time()
         
@@ -107,6 +109,7 @@ class RateTracker:
         """Add event occurrence with optional wait time."""
         now = time.time()
         self._events.append((now, count))
+        self._event_total += count
         
         if wait_time is not None and wait_time > 0:
             self._wait_times.append((now, wait_time))
@@ -123,11 +126,11 @@ class RateTracker:
         
         # Clean up events
         while self._events and self._events[0][0] < cutoff:
-            self._events.pop(0)
+            self._event_total -= self._events.popleft()[1]
             
         # Clean up wait times
         while self._wait_times and self._wait_times[0][0] < cutoff:
-            self._wait_times.pop(0)
+            self._wait_times.popleft()
     
     def get_rate(self) -> float:
         """Calculate current rate per second."""
@@ -137,13 +140,12 @@ class RateTracker:
         if not self._events:
             return 0.0
             
-        total = sum(count for _, count in self._events)
         window = now - self._events[0][0]
         
         if window <= 0:
             return 0.0
             
-        return total / window
+        return self._event_total / window
     
     def get_wait_time_stats(self) -> Dict[str, float]:
         """Get statistics about rate limit wait times."""
@@ -168,24 +170,27 @@ class RateTracker:
     def reset(self) -> None:
         """Reset all tracking data."""
         self._events.clear()
+        self._event_total = 0
         self._wait_times.clear()
         self._rate_limit_hits = 0
         self._last_cleanup = time.time()
 
 console = Console()
 
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+
 def format_size(size: Union[int, float]) -> str:
     """Format size in human readable format."""
     if size < 0:
         raise ValueError("Size must be non-negative")
     if size == 0:
         return "0 B"
+    if size < 1024:
+        return f"{size:.2f} B"
     
-    units = ['B', 'KB', 'MB', 'GB', 'TB', 'PB']
-    base = 1024
-    i = min(len(units) - 1, math.floor(math.log(size) / math.log(base)))
-    
-    return f"{size / (base ** i):.2f} {units[i]}"
+    # Each unit is 2**10 of the previous, so the bit length picks the unit
+    i = min(len(_SIZE_UNITS) - 1, (int(size).bit_length() - 1) // 10)
+    return f"{size / (1 << (i * 10)):.2f} {_SIZE_UNITS[i]}"
 
 @dataclass
 class ProgressData:
@@ -227,18 +232,42 @@ def create_progress_bar(
     
     return progress
 
+# MIME main types reported as media; everything else is not media
+_MEDIA_TYPES = frozenset({'image', 'video', 'application'})
+
+def _main_media_type(mime_type: Optional[str]) -> Optional[str]:
+    """Reduce a MIME type to its main type if that counts as media."""
+    if not mime_type:
+        return None
+    
+    main_type = mime_type.split('/')[0]
+    return main_type if main_type in _MEDIA_TYPES else None
+
+@lru_cache(maxsize=256)
+def _media_type_for_suffix(suffix: str) -> Optional[str]:
+    """Map a file suffix to its media type, memoized per suffix."""
+    mime_type, _ = mimetypes.guess_type('file' + suffix)
+    return _main_media_type(mime_type)
+
+def _depends_on_full_name(suffix: str) -> bool:
+    """Check if mimetypes resolves this suffix using the rest of the name."""
+    return suffix in mimetypes.encodings_map or suffix in mimetypes.suffix_map
+
 def get_media_type(filename: str) -> Optional[str]:
     """Get media type from filename."""
     try:
-        mime_type, _ = mimetypes.guess_type(filename)
-        if not mime_type:
-            return None
-        
-        main_type = mime_type.split('/')[0]
-        if main_type in {'image', 'video', 'application'}:
-            return main_type
+        suffix = os.path.splitext(filename)[1]
+        # Compressed (.tar.gz), aliased (.tgz) and data: names depend on
+        # more than the last suffix; resolve those from the full name
+        if (
+            _depends_on_full_name(suffix) or
+            _depends_on_full_name(suffix.lower()) or
+            str(filename).startswith('data:')
+        ):
+            mime_type, _ = mimetypes.guess_type(filename)
+            return _main_media_type(mime_type)
         
-        return None
+        return _media_type_for_suffix(suffix)
         
     except Exception as e:
         logger.error("Failed to get media type for %s: %s", filename, str(e))
@@ -4,7 +4,7 @@ import os
 import re
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Union, TypeVar, Generic
+from typing import Any, Dict, List, Optional, Pattern, Set, Union, TypeVar, Generic
 
 import yaml
 from jsonschema import validate, ValidationError as JsonSchemaError
@@ -25,11 +25,18 @@ class InputConfig:
     required: bool = True
     min_length: Optional[int] = None
     max_length: Optional[int] = None
-    pattern: Optional[str] = None
+    pattern: Optional[Union[str, Pattern]] = None
     choices: Optional[Set[str]] = None
     strip: bool = True
     lower: bool = False
     
+    # Compiled once so repeated prompts skip re's pattern cache
+    _compiled: Optional[Pattern] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        """Compile the validation pattern."""
+        self._compiled = re.compile(self.pattern) if self.pattern else None
+    
     def validate(self, value: str) -> str:
         """Validate and normalize input string."""
         if not value and self.required:
@@ -61,12 +68,12 @@ class InputConfig:
             )
         
         # Pattern check
-        if self.pattern and not re.match(self.pattern, value):
+        if self._compiled is not None and not self._compiled.match(value):
             raise ValidationError(
                 message="Input format is invalid",
                 field="input",
                 value=value,
-                details=f"Must match pattern: {self.pattern}"
+                details=f"Must match pattern: {self._compiled.pattern}"
             )
         
         # Choices check
@@ -2,17 +2,19 @@
 import asyncio
 import hashlib
 import re
+import sys
 from dataclasses import dataclass, field
-from typing import Dict, Optional, List, Set, Any, Union, Pattern
-from urllib.parse import urljoin, urlparse, unquote
+from functools import lru_cache
+from typing import Dict, FrozenSet, Mapping, Optional, List, Set, Any, Tuple, Union, Pattern
+from urllib.parse import urljoin, urlsplit, urlunsplit, unquote
 from pathlib import Path
 
 import aiohttp
-import aiodns
 from aiohttp import (
-    ClientResponse, ClientSession, ClientTimeout,
+    AsyncResolver, ClientResponse, ClientSession, ClientTimeout,
     TCPConnector, ClientError, ClientResponseError
 )
+from multidict import CIMultiDict, CIMultiDictProxy
 from yarl import URL
 
 from ..core.exceptions import (
@@ -21,22 +23,58 @@ from ..core.exceptions import (
 )
 from ..core.logger import setup_logger
 from ..core.error_handler import ErrorHandler
-from .storage import get_file_size, safe_remove
+from .storage import get_file_size, safe_remove, ThreadedFile
 from .core import validate_path
 
 logger = setup_logger('bunkrr.network')
 
+# Shared default timeout (ClientTimeout is immutable, so one instance is enough)
+DEFAULT_TIMEOUT = ClientTimeout(total=30, connect=10)
+
+# Shared read-only default headers; configs reference this instead of
+# building their own dict
+DEFAULT_HEADERS = CIMultiDictProxy(CIMultiDict({
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+    'Accept': '*/*',
+    'Accept-Language': 'en-US,en;q=0.5',
+    'Accept-Encoding': 'gzip, deflate'
+}))
+
+# Default patterns for Bunkr URLs
+_DOMAIN_PATTERN = r'(?:(?:www|cdn|i-burger|media-files)\.)?bunkr\.(?:site|ru|ph|is|to|fi)'
+_PATH_PATTERN = r'/(?:a|album|f|v)/[a-zA-Z0-9-_]{3,30}(?:/[^/]*)?$'
+_PROTOCOL_PATTERN = r'^(?:https?://)?'
+
+@lru_cache(maxsize=64)
+def _compile_url_patterns(pattern: str) -> Tuple[Pattern, Pattern]:
+    """Compile single-URL and multiline batch patterns once per pattern."""
+    return re.compile(pattern), re.compile(pattern, re.MULTILINE)
+
+# Compiled once at import; shared by every validator using the defaults
+_DEFAULT_URL_PATTERN, _DEFAULT_BATCH_PATTERN = _compile_url_patterns(
+    _PROTOCOL_PATTERN + _DOMAIN_PATTERN + _PATH_PATTERN
+)
+# Every default match contains this, whatever the subdomain or TLD
+_DEFAULT_REQUIRED_TEXT = 'bunkr.'
+
+@lru_cache(maxsize=4096)
+def _matches(pattern: Pattern, url: str) -> bool:
+    """Match URL against pattern, memoized since album pages repeat URLs."""
+    return pattern.fullmatch(url) is not None
+
 @dataclass
 class URLValidator:
     """URL validation with configurable patterns."""
     
-    # Default patterns for Bunkr URLs
-    domain_pattern: str = r'(?:(?:www|cdn|i-burger|media-files)\.)?bunkr\.(?:site|ru|ph|is|to|fi)'
-    path_pattern: str = r'/(?:a|album|f|v)/[a-zA-Z0-9-_]{3,30}(?:/[^/]*)?$'
-    protocol_pattern: str = r'^(?:https?://)?'
+    domain_pattern: str = _DOMAIN_PATTERN
+    path_pattern: str = _PATH_PATTERN
+    protocol_pattern: str = _PROTOCOL_PATTERN
     
     # Compiled patterns
     url_pattern: Pattern = field(init=False)
+    batch_pattern: Pattern = field(init=False)
+    # Text every match must contain; checked before running the regex
+    _required: str = field(init=False, default='', repr=False, compare=False)
     
     def __post_init__(self):
         """Compile regex pattern."""
@@ -45,11 +83,33 @@ class URLValidator:
             self.domain_pattern +
             self.path_pattern
         )
-        self.url_pattern = re.compile(pattern)
+        if pattern == _DEFAULT_URL_PATTERN.pattern:
+            self.url_pattern = _DEFAULT_URL_PATTERN
+            self.batch_pattern = _DEFAULT_BATCH_PATTERN
+            self._required = _DEFAULT_REQUIRED_TEXT
+        else:
+            # Validators with the same custom patterns share compiled objects
+            self.url_pattern, self.batch_pattern = _compile_url_patterns(pattern)
     
     def is_valid(self, url: str) -> bool:
         """Check if URL matches pattern."""
-        return bool(self.url_pattern.match(url))
+        # Reject obvious misses with a substring scan, keeping them out of
+        # the regex engine and the match cache
+        if not url or self._required not in url:
+            return False
+        return _matches(self.url_pattern, url)
+    
+    def is_valid_many(self, urls: List[str]) -> List[bool]:
+        """Check multiple URLs, returning one result per URL."""
+        if self._scan_all(urls):
+            return [True] * len(urls)
+        return [self.is_valid(url) for url in urls]
+    
+    def _scan_all(self, urls: List[str]) -> bool:
+        """Check whether every URL is valid with one scan over the batch."""
+        # Every line matching in full means every URL is valid
+        joined = '\n'.join(urls)
+        return [m.group() for m in self.batch_pattern.finditer(joined)] == list(urls)
     
     def validate(self, url: str) -> None:
         """Validate URL and raise error if invalid."""
@@ -77,9 +137,23 @@ class URLValidator:
                 value=urls
             )
         
+        if self._scan_all(urls):
+            return
+        
+        # Fall back to per-URL checks to report the offending URL
         for url in urls:
             self.validate(url)
 
+@lru_cache(maxsize=4096)
+def _normalize_url(url: str) -> str:
+    """Normalize URL, memoized since crawls revisit the same URLs."""
+    # yarl normalizes the path on construction; drop the fragment
+    normalized = URL(url).with_fragment(None)
+    # Ensure scheme is https
+    if not normalized.scheme:
+        normalized = normalized.with_scheme('https')
+    return str(normalized)
+
 async def normalize_url(url: str) -> str:
     """Normalize URL by removing fragments and normalizing path.
     
@@ -89,36 +163,71 @@ async def normalize_url(url: str) -> str:
     Returns:
         Normalized URL string
     """
-    parsed = URL(url)
-    # Remove fragments and normalize path
-    normalized = parsed.with_fragment(None).normalize()
-    # Ensure scheme is https
-    if not normalized.scheme:
-        normalized = normalized.with_scheme('https')
-    return str(normalized)
+    return _normalize_url(url)
+
+@lru_cache(maxsize=4096)
+def _normalize_client_url(url: str) -> str:
+    """Lowercase scheme and host, drop the fragment and default the path."""
+    # Empty and relative inputs have nothing to normalize
+    if '://' not in url:
+        return url
+    
+    parts = urlsplit(url)
+    netloc = parts.netloc
+    # Credentials are case-sensitive; only lowercase bare hosts
+    if '@' not in netloc:
+        netloc = netloc.lower()
+    return urlunsplit((
+        sys.intern(parts.scheme.lower()),
+        sys.intern(netloc),
+        parts.path or '/',
+        parts.query,
+        ''
+    ))
+
+def _new_hash(algorithm: str) -> Any:
+    """Create a digest for integrity checks.
+    
+    hashlib.new tries OpenSSL (and its SHA extensions) first and falls
+    back to the builtin implementation; the digest only guards against
+    corruption, so it is not flagged as security use.
+    """
+    return hashlib.new(algorithm, usedforsecurity=False)
+
+@lru_cache(maxsize=4096)
+def _join_urls(base: str, url: str) -> str:
+    """Join and normalize URLs, memoized for bases shared across paths."""
+    return _normalize_client_url(urljoin(str(URL(base)), url))
+
+@lru_cache(maxsize=4096)
+def extract_filename(url: str) -> str:
+    """Get the decoded last path segment of a URL.
+    
+    Query string and fragment are dropped before taking the tail, and only
+    the tail is unquoted. Returns an empty string for directory URLs.
+    """
+    tail = url.partition('#')[0].partition('?')[0].rpartition('/')[2]
+    return unquote(tail)
 
 @dataclass
 class HTTPConfig:
     """HTTP client configuration."""
     
-    timeout: ClientTimeout = field(default_factory=lambda: ClientTimeout(total=30, connect=10))
-    headers: Dict[str, str] = field(default_factory=lambda: {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-        'Accept': '*/*',
-        'Accept-Language': 'en-US,en;q=0.5',
-        'Accept-Encoding': 'gzip, deflate'
-    })
+    timeout: ClientTimeout = DEFAULT_TIMEOUT
+    headers: Mapping[str, str] = field(default_factory=lambda: DEFAULT_HEADERS)
     pool_size: int = 100
     max_requests_per_host: int = 10
+    dns_cache_ttl: int = 300
     retry_attempts: int = 3
     retry_delay: float = 1.0
-    retry_codes: Set[int] = field(default_factory=lambda: {408, 429, 500, 502, 503, 504})
+    retry_codes: FrozenSet[int] = frozenset({408, 429, 500, 502, 503, 504})
 
 @dataclass
 class DownloadConfig:
     """Download configuration."""
     
     chunk_size: int = 8192
+    buffer_size: int = 1048576  # 1MB
     progress_callback: Optional[Any] = None
     skip_existing: bool = False
     overwrite: bool = False
@@ -137,9 +246,14 @@ class HTTPClient:
         self.config = config or HTTPConfig()
         self.download_config = download_config or DownloadConfig()
         
+        # aiodns-backed resolver avoids a thread-pool getaddrinfo per lookup
+        self.resolver = AsyncResolver()
         self.connector = TCPConnector(
             limit=self.config.pool_size,
             limit_per_host=self.config.max_requests_per_host,
+            resolver=self.resolver,
+            use_dns_cache=True,
+            ttl_dns_cache=self.config.dns_cache_ttl,
             enable_cleanup_closed=True
         )
         
@@ -150,8 +264,14 @@ class HTTPClient:
             raise_for_status=True
         )
         
-        self.resolver = aiodns.DNSResolver()
         self.active_requests: Set[str] = set()
+        
+        # Retry schedule and codes are fixed per client; compute them once
+        self._retry_codes = frozenset(self.config.retry_codes)
+        self._retry_delays = tuple(
+            self.config.retry_delay * (attempt + 1)
+            for attempt in range(self.config.retry_attempts)
+        )
     
     @ErrorHandler.wrap_async
     async def close(self) -> None:
@@ -160,6 +280,7 @@ class HTTPClient:
             if not self.session.closed:
                 await self.session.close()
             await self.connector.close()
+            await self.resolver.close()
         except Exception as e:
             logger.error("Error closing HTTP client: %s", str(e))
             raise
@@ -182,9 +303,10 @@ class HTTPClient:
             
             for attempt in range(attempts):
                 try:
+                    # Session already carries config.headers; only pass overrides
                     response = await self.session.get(
                         normalized_url,
-                        headers={**self.config.headers, **(headers or {})},
+                        headers=headers,
                         timeout=timeout or self.config.timeout
                     )
                     
@@ -202,7 +324,7 @@ class HTTPClient:
                 except (ClientError, asyncio.TimeoutError) as e:
                     last_error = e
                     if isinstance(e, ClientResponseError):
-                        if e.status not in self.config.retry_codes or attempt == attempts - 1:
+                        if e.status not in self._retry_codes or attempt == attempts - 1:
                             raise HTTPError(
                                 message=str(e),
                                 url=normalized_url,
@@ -211,7 +333,7 @@ class HTTPClient:
                             )
                     
                     if attempt < attempts - 1:
-                        delay = self.config.retry_delay * (attempt + 1)
+                        delay = self._retry_delays[attempt]
                         logger.warning(
                             "Request failed (attempt %d/%d), retrying in %.1f seconds: %s",
                             attempt + 1,
@@ -253,28 +375,66 @@ class HTTPClient:
                     path=str(dest_path)
                 )
         
+        # Media payloads are already compressed; don't pay for a decode pass
+        request_headers = {'Accept-Encoding': 'identity'}
+        if headers:
+            request_headers.update(headers)
+        
         try:
-            async with await self.get(url, headers=headers) as response:
+            async with await self.get(url, headers=request_headers) as response:
                 total_size = int(response.headers.get('Content-Length', 0))
                 downloaded = 0
-                hash_obj = hashlib.new(cfg.hash_algorithm) if cfg.verify_hash else None
                 
-                with dest_path.open('wb') as f:
-                    async for chunk in response.content.iter_chunked(cfg.chunk_size):
-                        f.write(chunk)
-                        downloaded += len(chunk)
+                # Hash inline with the stream, and only when there is a
+                # server-provided digest to check against
+                expected_hash = (
+                    response.headers.get(f'X-{cfg.hash_algorithm}')
+                    if cfg.verify_hash else None
+                )
+                hash_obj = _new_hash(cfg.hash_algorithm) if expected_hash else None
+                pending: List[bytes] = []
+                pending_size = 0
+                
+                # Bind per-chunk lookups to locals for the hot loop
+                append = pending.append
+                buffer_size = cfg.buffer_size
+                update_hash = hash_obj.update if hash_obj else None
+                progress_callback = cfg.progress_callback
+                
+                # Raw fd: chunks are gathered and flushed with one writev in a
+                # worker thread. iter_any hands over buffers as received.
+                output = ThreadedFile(dest_path)
+                try:
+                    await output.open()
+                    async for chunk in response.content.iter_any():
+                        size = len(chunk)
+                        append(chunk)
+                        pending_size += size
+                        downloaded += size
+                        
+                        if update_hash:
+                            update_hash(chunk)
                         
-                        if hash_obj:
-                            hash_obj.update(chunk)
+                        # Progress is published once per flush, not per chunk
+                        if pending_size >= buffer_size:
+                            await output.write(pending)
+                            pending = []
+                            append = pending.append
+                            pending_size = 0
                             
-                        if cfg.progress_callback:
-                            cfg.progress_callback(downloaded, total_size)
+                            if progress_callback:
+                                progress_callback(downloaded, total_size)
+                    
+                    if pending:
+                        await output.write(pending)
+                finally:
+                    await asyncio.shield(output.close())
+                
+                if progress_callback:
+                    progress_callback(downloaded, total_size)
                 
                 # Verify hash if provided in headers
-                if (
-                    hash_obj and
-                    (expected_hash := response.headers.get(f'X-{cfg.hash_algorithm}'))
-                ):
+                if hash_obj:
                     actual_hash = hash_obj.hexdigest()
                     if actual_hash != expected_hash:
                         safe_remove(dest_path)
@@ -302,18 +462,13 @@ class HTTPClient:
     @ErrorHandler.wrap_async
     async def normalize_url(url: str) -> str:
         """Normalize URL by removing fragments and normalizing scheme."""
-        parsed = urlparse(url)
-        return parsed._replace(
-            scheme=parsed.scheme.lower() or 'http',
-            fragment='',
-            path=parsed.path or '/'
-        ).geturl()
+        return _normalize_client_url(url)
     
     @staticmethod
     @ErrorHandler.wrap_async
     async def join_urls(base: str, url: str) -> str:
         """Join URLs, handling edge cases."""
-        return await HTTPClient.normalize_url(urljoin(str(URL(base)), url))
+        return _join_urls(base, url)
     
     async def __aenter__(self):
         """Enter async context."""
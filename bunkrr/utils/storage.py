@@ -1,10 +1,14 @@
 """Storage utilities for the bunkrr package."""
+import asyncio
+import heapq
 import json
 import os
 import pickle
 import sqlite3
+import stat
 import sys
 import time
+import uuid
 import weakref
 import zlib
 from collections import OrderedDict, deque
@@ -14,12 +18,25 @@ from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any, Dict, Generator, Optional, Set, Tuple, Union, List, Protocol, runtime_checkable
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from ..core.exceptions import BunkrrError, CacheError, FileSystemError
 from ..core.logger import setup_logger
 from ..core.error_handler import ErrorHandler
 
 logger = setup_logger('bunkrr.storage')
 
+# Vectored writes (maximum buffers per writev call)
+_HAS_WRITEV = hasattr(os, 'writev')
+_IOV_MAX = 1024
+
+# Serialized entries starting with this byte hold orjson; anything else
+# (including entries written before the header existed) is a pickle
+_ORJSON_HEADER = b'\x01'
+
 @runtime_checkable
 class Cache(Protocol):
     """Base cache protocol defining the interface for all cache implementations."""
@@ -81,10 +98,18 @@ class CacheEntry:
     def size(self) -> int:
         """Get size of cached value in bytes (calculated lazily)."""
         if self._size is None:
-            try:
-                self._size = len(pickle.dumps(self.value))
-            except Exception:
-                self._size = 1
+            value = self.value
+            # Measure raw payloads directly; pickling a large page just to
+            # count its bytes is a full extra pass over the content
+            if isinstance(value, (bytes, bytearray, memoryview, str)):
+                self._size = len(value)
+            elif isinstance(getattr(value, 'body', None), bytes):
+                self._size = len(value.body)
+            else:
+                try:
+                    self._size = len(pickle.dumps(value))
+                except Exception:
+                    self._size = 1
         return self._size
     
     def is_expired(self, ttl: Optional[int]) -> bool:
@@ -93,10 +118,28 @@ class CacheEntry:
             return False
         return time.time() - self.timestamp > ttl
     
+    def _dumps(self) -> bytes:
+        """Serialize value and timestamp, preferring orjson over pickle."""
+        if orjson is not None:
+            try:
+                # Subclasses (Counter, OrderedDict, ...) compare equal to
+                # their base type, so reject them outright and pickle instead
+                data = orjson.dumps(
+                    [self.value, self.timestamp],
+                    option=orjson.OPT_PASSTHROUGH_SUBCLASS
+                )
+            except TypeError:
+                pass
+            else:
+                # Only keep JSON when it round-trips (tuples, sets, ... need pickle)
+                if orjson.loads(data)[0] == self.value:
+                    return _ORJSON_HEADER + data
+        return pickle.dumps((self.value, self.timestamp))
+    
     def to_bytes(self, compress: bool = True, level: int = 6) -> bytes:
         """Convert entry to bytes."""
         try:
-            data = pickle.dumps((self.value, self.timestamp))
+            data = self._dumps()
             if compress:
                 return zlib.compress(data, level)
             return data
@@ -109,7 +152,12 @@ class CacheEntry:
         try:
             if compress:
                 data = zlib.decompress(data)
-            value, timestamp = pickle.loads(data)
+            if data[:1] == _ORJSON_HEADER:
+                if orjson is None:
+                    raise CacheError("orjson is required to read this entry")
+                value, timestamp = orjson.loads(memoryview(data)[1:])
+            else:
+                value, timestamp = pickle.loads(data)
             return cls(value, timestamp)
         except Exception as e:
             raise CacheError(f"Failed to deserialize cache entry: {e}")
@@ -124,6 +172,8 @@ class MemoryCache:
         self._size = 0
         self._pending_eviction: deque[str] = deque()
         self._string_pool: Dict[str, str] = {}  # String interning pool
+        # (expiry, key) min-heap; only the soonest expiry is checked per call
+        self._expiry_heap: List[Tuple[float, str]] = []
     
     def _intern_key(self, key: str) -> str:
         """Intern string key to reduce memory usage."""
@@ -163,15 +213,39 @@ class MemoryCache:
         if len(self._pending_eviction) >= self.config.batch_size:
             self._evict_batch()
     
+    def _purge_expired(self) -> None:
+        """Drop entries whose TTL has passed."""
+        heap = self._expiry_heap
+        if not heap:
+            return
+        
+        now = time.time()
+        if heap[0][0] >= now:
+            return
+        
+        ttl = self.config.ttl
+        while heap and heap[0][0] < now:
+            expiry, key = heapq.heappop(heap)
+            entry = self._cache.get(key)
+            # Skip keys deleted or re-set since this expiry was queued
+            if entry is not None and entry.timestamp + ttl == expiry:
+                del self._cache[key]
+                self._size -= entry.size
+    
+    def _rebuild_expiry_heap(self) -> None:
+        """Rebuild the expiry heap from the live entries only."""
+        ttl = self.config.ttl
+        self._expiry_heap = [
+            (entry.timestamp + ttl, key) for key, entry in self._cache.items()
+        ]
+        heapq.heapify(self._expiry_heap)
+    
     def get(self, key: str) -> Optional[Any]:
         """Get value from cache."""
         key = self._intern_key(key)
-        if key not in self._cache:
-            return None
-            
-        entry = self._cache[key]
-        if entry.is_expired(self.config.ttl):
-            self.delete(key)
+        self._purge_expired()
+        entry = self._cache.get(key)
+        if entry is None:
             return None
             
         # Move to end (most recently used)
@@ -194,6 +268,15 @@ class MemoryCache:
         # Add new entry
         self._cache[key] = entry
         self._size += entry.size
+        if self.config.ttl is not None:
+            heapq.heappush(
+                self._expiry_heap,
+                (entry.timestamp + self.config.ttl, key)
+            )
+            # Re-set, deleted and evicted keys leave stale heap entries
+            # behind; rebuild once they outnumber the live ones
+            if len(self._expiry_heap) > 2 * len(self._cache) + 16:
+                self._rebuild_expiry_heap()
         
         # Move to end (most recently used)
         self._cache.move_to_end(key)
@@ -211,19 +294,13 @@ class MemoryCache:
         self._size = 0
         self._pending_eviction.clear()
         self._string_pool.clear()
+        self._expiry_heap.clear()
     
     def has(self, key: str) -> bool:
         """Check if key exists and is not expired."""
         key = self._intern_key(key)
-        if key not in self._cache:
-            return False
-            
-        entry = self._cache[key]
-        if entry.is_expired(self.config.ttl):
-            self.delete(key)
-            return False
-            
-        return True
+        self._purge_expired()
+        return key in self._cache
     
     def get_size(self) -> int:
         """Get current cache size."""
@@ -234,10 +311,11 @@ class FileCache(Cache):
     
     def __init__(self, config: CacheConfig):
         """Initialize file cache."""
-        super().__init__(config)
+        super().__init__()
         if not config.cache_dir:
             raise CacheError("cache_dir is required for FileCache")
             
+        self.config = config
         self.cache_dir = Path(config.cache_dir) / config.name
         ensure_directory(self.cache_dir)
         self._size = self._calculate_total_size()
@@ -246,52 +324,66 @@ class FileCache(Cache):
         """Get cache file path for key."""
         return self.cache_dir / f"{key}.cache"
     
+    def _scan_entries(self) -> List[Tuple[float, int, str]]:
+        """List cache files as (mtime, size, path), one stat per file."""
+        entries = []
+        with os.scandir(self.cache_dir) as it:
+            for entry in it:
+                if not entry.name.endswith(".cache"):
+                    continue
+                try:
+                    st = entry.stat()
+                except OSError:
+                    continue
+                entries.append((st.st_mtime, st.st_size, entry.path))
+        return entries
+    
     def _calculate_total_size(self) -> int:
         """Calculate total size of cache directory."""
-        total = 0
-        for path in self.cache_dir.glob("*.cache"):
-            try:
-                total += path.stat().st_size
-            except OSError:
-                continue
-        return total
+        try:
+            return sum(size for _, size, _ in self._scan_entries())
+        except OSError:
+            return 0
     
     def _evict_if_needed(self, new_size: int) -> None:
         """Evict files if cache would exceed max size."""
-        if self.config.max_size is None:
+        max_size = self.config.max_size
+        if max_size is None or self._size + new_size <= max_size:
             return
-            
-        while self._size + new_size > self.config.max_size:
-            # Get oldest file
+        
+        # Scan the directory once and evict oldest first from the snapshot
+        try:
+            entries = sorted(self._scan_entries())
+        except OSError:
+            return
+        
+        for _, size, path in entries:
+            if self._size + new_size <= max_size:
+                break
             try:
-                files = sorted(
-                    self.cache_dir.glob("*.cache"),
-                    key=lambda p: p.stat().st_mtime
-                )
-                if not files:
-                    break
-                    
-                oldest = files[0]
-                size = oldest.stat().st_size
-                oldest.unlink()
-                self._size -= size
-                logger.debug(
-                    "Evicted file %s from cache %s",
-                    oldest.name,
-                    self.config.name
-                )
+                os.unlink(path)
+            except FileNotFoundError:
+                continue
             except OSError:
                 break
+            self._size -= size
+            logger.debug(
+                "Evicted file %s from cache %s",
+                os.path.basename(path),
+                self.config.name
+            )
     
     def get(self, key: str) -> Optional[Any]:
         """Get value from cache file."""
         path = self._get_path(key)
-        if not path.exists():
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError:
             return None
             
         try:
             entry = CacheEntry.from_bytes(
-                path.read_bytes(),
+                data,
                 compress=self.config.compress
             )
             
@@ -319,16 +411,20 @@ class FileCache(Cache):
             )
             new_size = len(data)
             
-            # Remove old file if exists
-            if path.exists():
-                old_size = path.stat().st_size
-                self._size -= old_size
+            # Account for old file if exists
+            try:
+                self._size -= path.stat().st_size
+            except FileNotFoundError:
+                pass
             
             # Evict if needed
             self._evict_if_needed(new_size)
             
-            # Write new file
-            path.write_bytes(data)
+            # Write to a temporary file and swap it in so readers never
+            # see a partially written entry
+            tmp_path = path.with_name(f"{path.name}.tmp")
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, path)
             self._size += new_size
             
         except Exception as e:
@@ -339,10 +435,11 @@ class FileCache(Cache):
         """Delete cache file."""
         path = self._get_path(key)
         try:
-            if path.exists():
-                size = path.stat().st_size
-                path.unlink()
-                self._size -= size
+            size = path.stat().st_size
+            path.unlink()
+            self._size -= size
+        except FileNotFoundError:
+            pass
         except OSError as e:
             logger.error("Failed to delete cache file: %s", e)
     
@@ -377,7 +474,15 @@ class SQLiteCache:
             
         self.config = config
         self.db_path = Path(config.db_path)
+        # One table per cache name, so caches sharing a database file
+        # don't see each other's keys
+        self._table = '"cache_{}"'.format(
+            ''.join(c if c.isalnum() else '_' for c in config.name)
+        )
         self._connections: List[sqlite3.Connection] = []
+        # In-memory index of row timestamps; has() and expiry checks use it
+        # first and fall back to the table for keys it hasn't seen
+        self._timestamps: Dict[str, float] = {}
         self._init_db()
     
     def _init_db(self) -> None:
@@ -385,22 +490,52 @@ class SQLiteCache:
         try:
             with self._get_connection() as conn:
                 cursor = conn.cursor()
-                cursor.execute("""
-                    CREATE TABLE IF NOT EXISTS cache (
+                cursor.execute(f"""
+                    CREATE TABLE IF NOT EXISTS {self._table} (
                         key TEXT PRIMARY KEY,
                         value BLOB NOT NULL,
                         timestamp REAL NOT NULL,
                         size INTEGER NOT NULL
                     )
                 """)
-                cursor.execute("""
-                    CREATE INDEX IF NOT EXISTS idx_timestamp 
-                    ON cache(timestamp)
+                index = self._table[:-1] + '_timestamp"'
+                cursor.execute(f"""
+                    CREATE INDEX IF NOT EXISTS {index}
+                    ON {self._table}(timestamp)
                 """)
                 conn.commit()
+                self._load_timestamps(cursor)
         except sqlite3.Error as e:
             raise CacheError(f"Failed to initialize SQLite cache: {e}")
     
+    def _load_timestamps(self, cursor: sqlite3.Cursor) -> None:
+        """Rebuild the in-memory timestamp index from the table."""
+        cursor.execute(f"SELECT key, timestamp FROM {self._table}")
+        self._timestamps = dict(cursor.fetchall())
+    
+    def _fetch_timestamp(self, key: str) -> Optional[float]:
+        """Read a row timestamp from the table and add it to the index."""
+        try:
+            with self._get_connection() as conn:
+                row = conn.execute(
+                    f"SELECT timestamp FROM {self._table} WHERE key = ?",
+                    (key,)
+                ).fetchone()
+        except CacheError:
+            raise
+        except Exception as e:
+            raise CacheError(f"Failed to check key: {e}")
+        
+        if row is None:
+            return None
+        self._timestamps[key] = row[0]
+        return row[0]
+    
+    def _is_expired(self, timestamp: float) -> bool:
+        """Check if a row timestamp is past the TTL."""
+        ttl = self.config.ttl
+        return ttl is not None and time.time() - timestamp > ttl
+    
     @contextmanager
     def _get_connection(self) -> Generator[sqlite3.Connection, None, None]:
         """Get a database connection from the pool."""
@@ -422,7 +557,13 @@ class SQLiteCache:
                     timeout=30.0,
                     isolation_level=None
                 )
-                conn.execute("PRAGMA journal_mode=WAL")
+                # WAL with NORMAL sync avoids an fsync per committed set
+                conn.executescript(
+                    "PRAGMA journal_mode=WAL;"
+                    "PRAGMA synchronous=NORMAL;"
+                    "PRAGMA temp_store=MEMORY;"
+                    "PRAGMA cache_size=-8000;"
+                )
                 self._connections.append(conn)
             
             if conn is None:
@@ -438,19 +579,28 @@ class SQLiteCache:
     
     def get(self, key: str) -> Optional[Any]:
         """Get value from cache."""
+        # A known expired row is dropped without reading its value; keys
+        # missing from the index may have been written by another instance
+        timestamp = self._timestamps.get(key)
+        if timestamp is not None and self._is_expired(timestamp):
+            self.delete(key)
+            return None
+        
         try:
             with self._get_connection() as conn:
                 cursor = conn.cursor()
                 cursor.execute(
-                    "SELECT value, timestamp FROM cache WHERE key = ?",
+                    f"SELECT value, timestamp FROM {self._table} WHERE key = ?",
                     (key,)
                 )
                 row = cursor.fetchone()
                 
                 if not row:
+                    self._timestamps.pop(key, None)
                     return None
                     
                 value_bytes, timestamp = row
+                self._timestamps[key] = timestamp
                 entry = CacheEntry.from_bytes(
                     value_bytes,
                     compress=self.config.compress
@@ -484,24 +634,26 @@ class SQLiteCache:
                     current_size = self.get_size()
                     if current_size + len(value_bytes) > self.config.max_size:
                         # Remove oldest entries until we have space
-                        cursor.execute("""
-                            DELETE FROM cache 
+                        cursor.execute(f"""
+                            DELETE FROM {self._table}
                             WHERE key IN (
-                                SELECT key FROM cache 
+                                SELECT key FROM {self._table}
                                 ORDER BY timestamp ASC 
                                 LIMIT -1 OFFSET ?
                             )
                         """, (self.config.batch_size,))
+                        self._load_timestamps(cursor)
                 
                 # Insert or replace value
                 cursor.execute(
-                    """
-                    INSERT OR REPLACE INTO cache (key, value, timestamp, size)
+                    f"""
+                    INSERT OR REPLACE INTO {self._table} (key, value, timestamp, size)
                     VALUES (?, ?, ?, ?)
                     """,
                     (key, value_bytes, entry.timestamp, len(value_bytes))
                 )
                 conn.commit()
+                self._timestamps[key] = entry.timestamp
                 
         except CacheError:
             raise
@@ -512,8 +664,9 @@ class SQLiteCache:
         """Delete value from cache."""
         try:
             with self._get_connection() as conn:
-                conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+                conn.execute(f"DELETE FROM {self._table} WHERE key = ?", (key,))
                 conn.commit()
+                self._timestamps.pop(key, None)
         except Exception as e:
             raise CacheError(f"Failed to delete value: {e}")
     
@@ -521,21 +674,31 @@ class SQLiteCache:
         """Clear all values from cache."""
         try:
             with self._get_connection() as conn:
-                conn.execute("DELETE FROM cache")
+                conn.execute(f"DELETE FROM {self._table}")
                 conn.commit()
+                self._timestamps.clear()
         except Exception as e:
             raise CacheError(f"Failed to clear cache: {e}")
     
     def has(self, key: str) -> bool:
         """Check if key exists and is not expired."""
-        return self.get(key) is not None
+        timestamp = self._timestamps.get(key)
+        if timestamp is None:
+            # Not indexed yet; the row may come from another instance
+            timestamp = self._fetch_timestamp(key)
+            if timestamp is None:
+                return False
+        if self._is_expired(timestamp):
+            self.delete(key)
+            return False
+        return True
     
     def get_size(self) -> int:
         """Get current cache size in bytes."""
         try:
             with self._get_connection() as conn:
                 cursor = conn.cursor()
-                cursor.execute("SELECT COALESCE(SUM(size), 0) FROM cache")
+                cursor.execute(f"SELECT COALESCE(SUM(size), 0) FROM {self._table}")
                 return cursor.fetchone()[0]
         except Exception as e:
             raise CacheError(f"Failed to get cache size: {e}")
@@ -550,16 +713,39 @@ class SQLiteCache:
         self._connections.clear()
 
 # Filesystem utilities
+# Directories already confirmed writable, keyed by (st_dev, st_ino) so a
+# known directory costs one stat instead of mkdir + access
+_WRITABLE_DIRS: OrderedDict[Tuple[int, int], None] = OrderedDict()
+_WRITABLE_DIRS_MAX = 256
+
 def ensure_directory(path: Path) -> None:
     """Ensure directory exists and is writable."""
     try:
-        path.mkdir(parents=True, exist_ok=True)
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            path.mkdir(parents=True, exist_ok=True)
+            st = os.stat(path)
+        else:
+            if not stat.S_ISDIR(st.st_mode):
+                # Let mkdir raise the usual error for a non-directory
+                path.mkdir(parents=True, exist_ok=True)
+        
+        key = (st.st_dev, st.st_ino)
+        if key in _WRITABLE_DIRS:
+            _WRITABLE_DIRS.move_to_end(key)
+            return
+        
         if not os.access(path, os.W_OK):
             raise FileSystemError(
                 message="Directory not writable",
                 path=str(path),
                 operation="create"
             )
+        
+        _WRITABLE_DIRS[key] = None
+        if len(_WRITABLE_DIRS) > _WRITABLE_DIRS_MAX:
+            _WRITABLE_DIRS.popitem(last=False)
     except Exception as e:
         if isinstance(e, FileSystemError):
             raise
@@ -582,18 +768,106 @@ def get_file_size(path: Path) -> int:
             details=str(e)
         )
 
+def write_chunks(fd: int, chunks: List[bytes]) -> int:
+    """Write chunks to a file descriptor with as few syscalls as possible.
+    
+    Pending chunks are handed to os.writev as-is instead of being copied
+    into a contiguous buffer first. Partial writes are resumed.
+    
+    Args:
+        fd: Open file descriptor
+        chunks: Buffers to write, in order
+        
+    Returns:
+        Number of bytes written
+    """
+    views = [memoryview(chunk) for chunk in chunks if chunk]
+    count = len(views)
+    total = 0
+    index = 0
+    
+    while index < count:
+        if _HAS_WRITEV:
+            written = os.writev(fd, views[index:index + _IOV_MAX])
+        else:
+            written = os.write(fd, views[index])
+        total += written
+        
+        # Skip fully written buffers and trim a partially written one
+        while index < count and written >= len(views[index]):
+            written -= len(views[index])
+            index += 1
+        if written:
+            views[index] = views[index][written:]
+    
+    return total
+
+class ThreadedFile:
+    """Raw output file whose open, writes and close run in worker threads.
+    
+    Worker calls are shielded from cancellation and close() waits for the
+    one in flight, so a cancelled download neither leaks the descriptor nor
+    closes it underneath a running write.
+    """
+    
+    def __init__(self, path: Path):
+        self._path = path
+        self._fd: Optional[int] = None
+        self._inflight: Optional[asyncio.Future] = None
+    
+    async def _call(self, func, *args) -> Any:
+        """Run func in a worker thread that cancellation can't interrupt."""
+        self._inflight = asyncio.ensure_future(asyncio.to_thread(func, *args))
+        return await asyncio.shield(self._inflight)
+    
+    def _open(self) -> None:
+        # Set from the worker so a cancelled open still records the fd
+        self._fd = os.open(
+            self._path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644
+        )
+    
+    async def open(self) -> None:
+        """Create or truncate the file."""
+        await self._call(self._open)
+    
+    async def write(self, chunks: List[bytes]) -> None:
+        """Write a batch of chunks with a single writev."""
+        await self._call(write_chunks, self._fd, chunks)
+    
+    async def close(self) -> None:
+        """Close the file once any in-flight open or write has finished."""
+        inflight = self._inflight
+        if inflight is not None:
+            await asyncio.wait({inflight})
+            # Errors were raised to the caller unless it was cancelled
+            inflight.exception()
+        
+        if self._fd is not None:
+            fd, self._fd = self._fd, None
+            await asyncio.to_thread(os.close, fd)
+
 def safe_remove(path: Path) -> None:
     """Safely remove file if it exists."""
     try:
-        if path.exists():
-            path.unlink()
+        path.unlink(missing_ok=True)
     except Exception as e:
         logger.error("Failed to remove file %s: %s", path, e)
 
+class _FilenameTable(dict):
+    """str.translate table keeping alphanumerics and "- _.", filled lazily."""
+    
+    def __missing__(self, codepoint: int) -> Optional[int]:
+        char = chr(codepoint)
+        kept = codepoint if char.isalnum() or char in "- _." else None
+        self[codepoint] = kept
+        return kept
+
+_FILENAME_TABLE = _FilenameTable()
+
 def sanitize_filename(filename: str) -> str:
     """Sanitize filename for filesystem."""
-    # Remove invalid characters
-    safe_name = "".join(c for c in filename if c.isalnum() or c in "- _.")
+    # Remove invalid characters in a single translate pass
+    safe_name = filename.translate(_FILENAME_TABLE)
     # Remove leading/trailing spaces and dots
     safe_name = safe_name.strip(". ")
     # Ensure filename is not empty
@@ -605,21 +879,53 @@ def get_unique_path(path: Path) -> Path:
     """Get unique path by appending number if needed."""
     if not path.exists():
         return path
-        
+    
+    # One directory listing instead of a stat per numbered candidate
+    try:
+        with os.scandir(path.parent) as entries:
+            existing = {entry.name for entry in entries}
+    except OSError:
+        existing = set()
+    
+    stem = path.stem
+    suffix = path.suffix
     counter = 1
     while True:
-        stem = path.stem
-        suffix = path.suffix
-        new_path = path.with_name(f"{stem}_{counter}{suffix}")
-        if not new_path.exists():
-            return new_path
+        name = f"{stem}_{counter}{suffix}"
+        if name not in existing:
+            new_path = path.with_name(name)
+            # Confirm on disk; the listing misses case-insensitive matches
+            if not new_path.exists():
+                return new_path
         counter += 1
 
+def _can_create_in(directory: Path) -> bool:
+    """Check if a file can be created in directory by creating one."""
+    # A unique name never collides with another probe or a real file, so
+    # only a successful create and delete counts as writable
+    probe = directory / f".bunkrr_probe_{uuid.uuid4().hex}"
+    try:
+        fd = os.open(probe, os.O_CREAT | os.O_WRONLY | os.O_EXCL, 0o600)
+    except OSError:
+        return False
+    os.close(fd)
+    try:
+        os.unlink(probe)
+    except OSError:
+        return False
+    return True
+
 def is_valid_path(path: Path) -> bool:
     """Check if path is valid and writable."""
+    # Ask the filesystem directly; os.access misjudges ACLs and
+    # read-only mounts. O_NONBLOCK keeps FIFOs from blocking the open.
     try:
-        if path.exists():
-            return os.access(path, os.W_OK)
-        return os.access(path.parent, os.W_OK)
+        fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_NONBLOCK)
+    except IsADirectoryError:
+        return _can_create_in(Path(path))
+    except FileNotFoundError:
+        return _can_create_in(Path(path).parent)
     except Exception:
-        return False 
+        return False
+    os.close(fd)
+    return True
@@ -1,10 +1,13 @@
 """Shared test fixtures and configuration."""
+import errno
 import os
 import pytest
 import tempfile
 import asyncio
 from pathlib import Path
 
+from bs4 import BeautifulSoup
+
 # Constants for testing
 TEST_TIMEOUT = 30  # seconds
 TEST_CHUNK_SIZE = 8192  # bytes
@@ -17,12 +20,44 @@ def event_loop():
     yield loop
     loop.close()
 
+@pytest.fixture(scope="session", autouse=True)
+def prewarm_lxml():
+    """Parse a throwaway document so lxml setup stays out of timed tests."""
+    BeautifulSoup("<html/>", "lxml")
+
 @pytest.fixture
 def temp_dir():
     """Create a temporary directory for test files."""
     with tempfile.TemporaryDirectory() as tmp_dir:
         yield Path(tmp_dir)
 
+@pytest.fixture
+def readonly_dir(tmp_path, monkeypatch):
+    """Create a directory that refuses writes without relying on chmod.
+    
+    chmod is ignored for root and unreliable on Windows, so writes are
+    denied in-process: write opens of files inside the directory fail
+    with EACCES and os.access reports it as not writable.
+    """
+    path = tmp_path / "readonly"
+    path.mkdir()
+    real_open, real_access = os.open, os.access
+    
+    def fake_open(target, flags, *args, **kwargs):
+        if flags & (os.O_WRONLY | os.O_RDWR) and path in Path(target).parents:
+            raise PermissionError(errno.EACCES, "Permission denied", str(target))
+        return real_open(target, flags, *args, **kwargs)
+    
+    def fake_access(target, mode, *args, **kwargs):
+        target = Path(target)
+        if mode & os.W_OK and (target == path or path in target.parents):
+            return False
+        return real_access(target, mode, *args, **kwargs)
+    
+    monkeypatch.setattr(os, "open", fake_open)
+    monkeypatch.setattr(os, "access", fake_access)
+    return path
+
 @pytest.fixture
 def mock_config():
     """Provide mock configuration for testing."""
@@ -11,6 +11,7 @@ from bunkrr.core.exceptions import (
     HTTPError,
     ConfigVersionError,
     ShutdownError,
+    ParsingError,
     ERROR_CODES
 )
 
@@ -123,3 +124,11 @@ class TestErrorCodes:
         assert issubclass(ConfigError, BunkrrError)
         assert issubclass(ValidationError, BunkrrError)
         assert issubclass(ShutdownError, BunkrrError) 
+        
+    def test_retriable_flag(self):
+        """Test retriable class attribute."""
+        assert RateLimitError.retriable
+        assert ParsingError.retriable
+        assert not BunkrrError.retriable
+        assert not HTTPError.retriable
+        assert not DownloadError.retriable
@@ -28,6 +28,7 @@ async def test_token_acquisition():
     tokens = await rate_limiter.get_current_tokens()
     assert tokens < 1
 
+@pytest.mark.slow
 @pytest.mark.asyncio
 async def test_token_replenishment():
     """Test that tokens are replenished over time."""
@@ -44,6 +45,7 @@ async def test_token_replenishment():
     current_tokens = await rate_limiter.get_current_tokens()
     assert current_tokens > initial_tokens
 
+@pytest.mark.slow
 @pytest.mark.asyncio
 async def test_rate_limiting():
     """Test that requests are properly rate limited."""
@@ -60,6 +62,7 @@ async def test_rate_limiting():
     duration = time.monotonic() - start_time
     assert duration >= 1.5  # Should take at least 1.5 seconds
 
+@pytest.mark.slow
 @pytest.mark.asyncio
 async def test_concurrent_requests():
     """Test handling of concurrent requests."""
@@ -71,7 +74,9 @@ async def test_concurrent_requests():
     
     # Launch 4 concurrent requests
     start_time = time.monotonic()
-    results = await asyncio.gather(*[make_request() for _ in range(4)])
+    async with asyncio.TaskGroup() as tg:
+        tasks = [tg.create_task(make_request()) for _ in range(4)]
+    results = [task.result() for task in tasks]
     
     # Check that requests were properly spaced
     timestamps = sorted(results)
@@ -79,6 +84,7 @@ async def test_concurrent_requests():
         time_diff = timestamps[i] - timestamps[i-1]
         assert time_diff >= 0.45  # Allow small margin for timing variations
 
+@pytest.mark.slow
 @pytest.mark.asyncio
 async def test_bucket_size_limit():
     """Test that bucket doesn't exceed maximum size."""
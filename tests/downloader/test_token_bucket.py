@@ -0,0 +1,63 @@
+"""Test the downloader rate limiter under concurrent use."""
+import asyncio
+import pytest
+from types import SimpleNamespace
+
+from bunkrr.downloader import rate_limiter as rate_limiter_module
+from bunkrr.downloader.rate_limiter import RateLimiter
+
+@pytest.fixture
+def fake_clock(monkeypatch):
+    """Advance the limiter clock on sleep instead of waiting for real."""
+    now = [1000.0]
+
+    async def sleep(delay):
+        now[0] += delay
+        await asyncio.sleep(0)
+
+    monkeypatch.setattr(
+        rate_limiter_module,
+        "time",
+        SimpleNamespace(monotonic=lambda: now[0])
+    )
+    monkeypatch.setattr(
+        rate_limiter_module,
+        "asyncio",
+        SimpleNamespace(sleep=sleep, CancelledError=asyncio.CancelledError)
+    )
+    return now
+
+@pytest.mark.asyncio
+async def test_acquire_without_waiting(fake_clock):
+    """Test available tokens are taken without advancing the clock."""
+    limiter = RateLimiter(5, 60)
+
+    for _ in range(5):
+        await limiter.acquire()
+
+    assert fake_clock[0] == 1000.0
+    assert limiter.current_tokens < 1
+
+@pytest.mark.asyncio
+async def test_concurrent_acquire(fake_clock):
+    """Test concurrent callers never exceed the window limit."""
+    limiter = RateLimiter(3, 1)
+    admitted = []
+
+    async def worker():
+        await limiter.acquire()
+        admitted.append(fake_clock[0])
+
+    async with asyncio.TaskGroup() as tg:
+        for _ in range(12):
+            tg.create_task(worker())
+
+    assert len(admitted) == 12
+    # The full bucket is handed out at once, then callers queue
+    assert admitted[:3] == [1000.0] * 3
+    assert admitted[3] > 1000.0
+
+    # No window holds more admissions than the bucket allows
+    for t in admitted:
+        in_window = [s for s in admitted if t - 1 < s <= t]
+        assert len(in_window) <= 3
@@ -1,6 +1,7 @@
 """Performance tests for connection pool and rate limiter."""
 import asyncio
 import time
+from dataclasses import dataclass
 from pathlib import Path
 import pytest
 from unittest.mock import AsyncMock, patch
@@ -8,6 +9,13 @@ from unittest.mock import AsyncMock, patch
 from bunkrr.data_processing import MediaProcessor, ConnectionMetrics
 from bunkrr.config import DownloadConfig
 
+def format_metrics(metrics):
+    """Format metrics as lines for a single print call."""
+    return "\n".join(
+        f"{key}: {value:.2f}" if isinstance(value, float) else f"{key}: {value}"
+        for key, value in metrics.items()
+    )
+
 @pytest.fixture
 def config():
     """Create test configuration."""
@@ -21,16 +29,35 @@ def config():
         download_timeout=300
     )
 
+@dataclass(frozen=True)
+class RateLimitTiming:
+    """Expected spacing between rate-limited requests."""
+    expected_min: float
+    lower: float
+    upper: float
+
+@pytest.fixture
+def rate_limit_timing(config):
+    """Compute rate limiter timing bounds once from the config."""
+    expected_min = config.rate_window / config.rate_limit
+    return RateLimitTiming(
+        expected_min=expected_min,
+        lower=expected_min * 0.8,
+        upper=expected_min * 1.5
+    )
+
+@pytest.mark.slow
 @pytest.mark.asyncio
 async def test_connection_pool_performance(config):
     """Test connection pool performance under load."""
     async with MediaProcessor(config) as processor:
-        # Mock successful responses
+        # Mock successful responses, sharing one response object
+        mock_resp = AsyncMock()
+        mock_resp.status = 200
+        mock_resp.text = AsyncMock(return_value="test content")
+        
         async def mock_response(*args, **kwargs):
             await asyncio.sleep(0.1)  # Simulate network latency
-            mock_resp = AsyncMock()
-            mock_resp.status = 200
-            mock_resp.text = AsyncMock(return_value="test content")
             return mock_resp
         
         processor._session.request = AsyncMock(side_effect=mock_response)
@@ -59,20 +86,16 @@ async def test_connection_pool_performance(config):
         print(f"Successful requests: {successful}")
         print(f"Total duration: {duration:.2f}s")
         print(f"Requests per second: {len(tasks)/duration:.2f}")
-        print("\nConnection Metrics:")
-        for key, value in metrics.items():
-            if isinstance(value, float):
-                print(f"{key}: {value:.2f}")
-            else:
-                print(f"{key}: {value}")
+        print("\nConnection Metrics:\n" + format_metrics(metrics))
         
         # Assert performance requirements
         assert successful == len(tasks), "All requests should succeed"
         assert duration < 5.0, "Should complete within 5 seconds"
         assert metrics['failed_connections'] == 0, "Should have no failed connections"
 
+@pytest.mark.slow
 @pytest.mark.asyncio
-async def test_rate_limiter_performance(config):
+async def test_rate_limiter_performance(config, rate_limit_timing):
     """Test rate limiter performance and consistency."""
     processor = MediaProcessor(config)
     
@@ -85,8 +108,8 @@ async def test_rate_limiter_performance(config):
     
     # Make concurrent requests
     start_time = time.monotonic()
-    tasks = [make_request() for _ in range(15)]
-    await asyncio.gather(*tasks)
+    async with asyncio.TaskGroup() as tg:
+        tasks = [tg.create_task(make_request()) for _ in range(15)]
     end_time = time.monotonic()
     
     # Calculate time differences between requests
@@ -104,12 +127,13 @@ async def test_rate_limiter_performance(config):
     print(f"Max time between requests: {max_diff:.3f}s")
     
     # Verify rate limiting
-    expected_min_time = config.rate_window / config.rate_limit
-    assert min_diff >= expected_min_time * 0.8, \
-        f"Minimum time between requests ({min_diff:.3f}s) should be at least {expected_min_time * 0.8:.3f}s"
-    assert max_diff <= expected_min_time * 1.5, \
-        f"Maximum time between requests ({max_diff:.3f}s) should be at most {expected_min_time * 1.5:.3f}s"
+    lower, upper = rate_limit_timing.lower, rate_limit_timing.upper
+    assert min_diff >= lower, \
+        f"Minimum time between requests ({min_diff:.3f}s) should be at least {lower:.3f}s"
+    assert max_diff <= upper, \
+        f"Maximum time between requests ({max_diff:.3f}s) should be at most {upper:.3f}s"
 
+@pytest.mark.slow
 @pytest.mark.asyncio
 async def test_concurrent_downloads_performance(config, tmp_path):
     """Test performance of concurrent downloads."""
@@ -119,14 +143,15 @@ async def test_concurrent_downloads_performance(config, tmp_path):
             return f"https://cdn.bunkr.site/files/{url.split('/')[-1]}"
         processor._get_download_url = AsyncMock(side_effect=mock_get_download_url)
         
-        # Mock file download
+        # Mock file download, sharing one response object
+        mock_resp = AsyncMock()
+        mock_resp.status = 200
+        mock_resp.content.iter_chunked = AsyncMock(
+            return_value=[b"test" * 256]  # 1KB chunks
+        )
+        
         async def mock_download_response(*args, **kwargs):
             await asyncio.sleep(0.2)  # Simulate download time
-            mock_resp = AsyncMock()
-            mock_resp.status = 200
-            mock_resp.content.iter_chunked = AsyncMock(
-                return_value=[b"test" * 256]  # 1KB chunks
-            )
             return mock_resp
         
         processor._session.request = AsyncMock(side_effect=mock_download_response)
@@ -139,13 +164,14 @@ async def test_concurrent_downloads_performance(config, tmp_path):
         
         # Start downloads
         start_time = time.monotonic()
-        tasks = [
-            processor._download_file(url, path)
-            for url, path in test_files
-        ]
-        
-        # Wait for downloads to complete
-        results = await asyncio.gather(*tasks)
+        async with asyncio.TaskGroup() as tg:
+            tasks = [
+                tg.create_task(processor._download_file(url, path))
+                for url, path in test_files
+            ]
+        
+        # Downloads are complete once the task group exits
+        results = [task.result() for task in tasks]
         end_time = time.monotonic()
         
         # Get metrics
@@ -164,12 +190,7 @@ async def test_concurrent_downloads_performance(config, tmp_path):
         print(f"Average download time: {duration/len(test_files):.2f}s")
         print(f"Total data transferred: {total_bytes/1024:.2f}KB")
         print(f"Transfer rate: {(total_bytes/1024)/duration:.2f}KB/s")
-        print("\nConnection Pool Metrics:")
-        for key, value in metrics.items():
-            if isinstance(value, float):
-                print(f"{key}: {value:.2f}")
-            else:
-                print(f"{key}: {value}")
+        print("\nConnection Pool Metrics:\n" + format_metrics(metrics))
         
         # Verify performance requirements
         assert successful == len(test_files), "All downloads should succeed"
@@ -1,8 +1,20 @@
 """Tests for HTML parser optimizations."""
 import pytest
+import soupsieve
 from bs4 import BeautifulSoup, SoupStrainer
 from bunkrr.data_processing import create_soup, ALBUM_STRAINER, MEDIA_STRAINER
 
+# Selectors compiled once and reused across tests
+SEL_TITLE = soupsieve.compile('meta[property="og:title"]')
+SEL_H1 = soupsieve.compile('h1.truncate')
+SEL_ITEM = soupsieve.compile('div.theItem')
+SEL_IRRELEVANT = soupsieve.compile('div.irrelevant')
+SEL_FILENAME = soupsieve.compile('p[style="display:none;"]')
+SEL_SIZE = soupsieve.compile('p.theSize')
+SEL_DATE = soupsieve.compile('span.theDate')
+SEL_THUMBNAIL = soupsieve.compile('img.grid-images_box-img')
+SEL_DOWNLOAD = soupsieve.compile('a[aria-label="download"]')
+
 # Sample HTML content for testing
 ALBUM_HTML = """
 <!DOCTYPE html>
@@ -100,6 +112,17 @@ MIXED_CONTENT_HTML = """
 </html>
 """
 
+LARGE_ITEM_TEMPLATE = """
+        <div class="theItem">
+            <a aria-label="download" href="/f/item{i}">
+                <p style="display:none;">file{i}.mp4</p>
+                <p class="theSize">10 MB</p>
+                <span class="theDate">2024-01-15</span>
+                <img class="grid-images_box-img" src="thumb{i}.jpg">
+            </a>
+        </div>
+        """
+
 @pytest.mark.asyncio
 async def test_create_soup_caching():
     """Test that create_soup properly caches results."""
@@ -124,13 +147,13 @@ def test_album_strainer_optimization():
     full_soup = BeautifulSoup(ALBUM_HTML, 'lxml')
     
     # Verify strainer included required elements
-    assert soup_with_strainer.find('meta', property='og:title') is not None
-    assert soup_with_strainer.find('h1', class_='truncate') is not None
-    assert soup_with_strainer.find('div', class_='theItem') is not None
+    assert SEL_TITLE.select_one(soup_with_strainer) is not None
+    assert SEL_H1.select_one(soup_with_strainer) is not None
+    assert SEL_ITEM.select_one(soup_with_strainer) is not None
     
     # Verify strainer excluded irrelevant elements
-    assert soup_with_strainer.find('div', class_='irrelevant') is None
-    assert full_soup.find('div', class_='irrelevant') is not None
+    assert SEL_IRRELEVANT.select_one(soup_with_strainer) is None
+    assert SEL_IRRELEVANT.select_one(full_soup) is not None
 
 def test_media_strainer_optimization():
     """Test that MEDIA_STRAINER correctly limits parsing scope."""
@@ -145,8 +168,8 @@ def test_media_strainer_optimization():
     assert soup_with_strainer.find('source') is not None
     
     # Verify strainer excluded irrelevant elements
-    assert soup_with_strainer.find('div', class_='irrelevant') is None
-    assert full_soup.find('div', class_='irrelevant') is not None
+    assert SEL_IRRELEVANT.select_one(soup_with_strainer) is None
+    assert SEL_IRRELEVANT.select_one(full_soup) is not None
 
 def test_parser_performance():
     """Test performance improvement with lxml parser and strainers."""
@@ -172,28 +195,28 @@ def test_parse_album_content():
     soup = create_soup(ALBUM_HTML, 'lxml', ALBUM_STRAINER)
     
     # Test meta title extraction
-    meta_title = soup.find('meta', property='og:title', attrs={'content': True})
+    meta_title = SEL_TITLE.select_one(soup)
     assert meta_title['content'] == 'Test Album'
     
     # Test h1 title extraction
-    h1_title = soup.find('h1', class_='truncate')
+    h1_title = SEL_H1.select_one(soup)
     assert h1_title.get_text(strip=True) == 'Test Album Header'
     
     # Test media item extraction
-    media_item = soup.find('div', class_='theItem')
+    media_item = SEL_ITEM.select_one(soup)
     assert media_item is not None
     
     # Test file info extraction
-    filename = media_item.find('p', style='display:none;').get_text(strip=True)
+    filename = SEL_FILENAME.select_one(media_item).get_text(strip=True)
     assert filename == 'test_file.mp4'
     
-    size = media_item.find('p', class_='theSize').get_text(strip=True)
+    size = SEL_SIZE.select_one(media_item).get_text(strip=True)
     assert size == '10 MB'
     
-    date = media_item.find('span', class_='theDate').get_text(strip=True)
+    date = SEL_DATE.select_one(media_item).get_text(strip=True)
     assert date == '2024-01-15'
     
-    thumbnail = media_item.find('img', class_='grid-images_box-img')['src']
+    thumbnail = SEL_THUMBNAIL.select_one(media_item)['src']
     assert thumbnail == 'thumbnail.jpg'
 
 def test_parse_media_content():
@@ -213,12 +236,12 @@ async def test_malformed_html_handling():
     soup = create_soup(MALFORMED_HTML, 'lxml', ALBUM_STRAINER)
     
     # Should still find valid elements
-    assert soup.find('meta', property='og:title') is not None
-    assert soup.find('h1', class_='truncate') is not None
-    assert soup.find('div', class_='theItem') is not None
+    assert SEL_TITLE.select_one(soup) is not None
+    assert SEL_H1.select_one(soup) is not None
+    assert SEL_ITEM.select_one(soup) is not None
     
     # Should handle unclosed tags
-    h1 = soup.find('h1', class_='truncate')
+    h1 = SEL_H1.select_one(soup)
     assert h1 is not None
     # Extract text and clean it
     h1_text = ' '.join(h1.stripped_strings).split('test_file')[0].strip()
@@ -230,8 +253,8 @@ async def test_empty_html_handling():
     soup = create_soup(EMPTY_HTML, 'lxml', ALBUM_STRAINER)
     
     # Should handle empty content gracefully
-    assert soup.find('meta', property='og:title') is None
-    assert soup.find('div', class_='theItem') is None
+    assert SEL_TITLE.select_one(soup) is None
+    assert SEL_ITEM.select_one(soup) is None
     assert soup.find('video') is None
 
 @pytest.mark.asyncio
@@ -240,15 +263,15 @@ async def test_nested_content_handling():
     soup = create_soup(NESTED_HTML, 'lxml', ALBUM_STRAINER)
     
     # Should find both outer and nested items
-    items = soup.find_all('div', class_='theItem')
+    items = SEL_ITEM.select(soup)
     assert len(items) == 2
     
     # Should find both download links
-    links = soup.find_all('a', attrs={'aria-label': 'download'})
+    links = SEL_DOWNLOAD.select(soup)
     assert len(links) == 2
     
     # Verify filenames
-    filenames = [p.get_text(strip=True) for p in soup.find_all('p', style='display:none;')]
+    filenames = [p.get_text(strip=True) for p in SEL_FILENAME.select(soup)]
     assert 'nested.mp4' in filenames
     assert 'outer.mp4' in filenames
 
@@ -257,31 +280,23 @@ async def test_mixed_content_handling():
     """Test parsing of mixed content types."""
     # Test with album strainer
     album_soup = create_soup(MIXED_CONTENT_HTML, 'lxml', ALBUM_STRAINER)
-    assert album_soup.find('div', class_='theItem') is not None
+    assert SEL_ITEM.select_one(album_soup) is not None
     assert album_soup.find('video') is None  # Should not include video tag
     
     # Test with media strainer
     media_soup = create_soup(MIXED_CONTENT_HTML, 'lxml', MEDIA_STRAINER)
     assert media_soup.find('video') is not None
-    assert media_soup.find('div', class_='theItem') is None  # Should not include item div
+    assert SEL_ITEM.select_one(media_soup) is None  # Should not include item div
 
 @pytest.mark.asyncio
 async def test_large_html_performance():
     """Test parsing performance with large HTML."""
-    # Create large HTML with many items
-    large_html = """<!DOCTYPE html><html><body>"""
-    for i in range(1000):  # 1000 items
-        large_html += f"""
-        <div class="theItem">
-            <a aria-label="download" href="/f/item{i}">
-                <p style="display:none;">file{i}.mp4</p>
-                <p class="theSize">10 MB</p>
-                <span class="theDate">2024-01-15</span>
-                <img class="grid-images_box-img" src="thumb{i}.jpg">
-            </a>
-        </div>
-        """
-    large_html += """</body></html>"""
+    # Create large HTML with many items (1000), joined once
+    large_html = ''.join((
+        """<!DOCTYPE html><html><body>""",
+        *(LARGE_ITEM_TEMPLATE.format(i=i) for i in range(1000)),
+        """</body></html>"""
+    ))
     
     import time
     
@@ -308,8 +323,8 @@ async def test_large_html_performance():
     assert strainer_time < full_time, f"Strainer time ({strainer_time:.3f}s) not faster than full parse ({full_time:.3f}s)"
     
     # Both should find all items
-    assert len(soup_with_strainer.find_all('div', class_='theItem')) == 1000
-    assert len(soup_without_strainer.find_all('div', class_='theItem')) == 1000
+    assert len(SEL_ITEM.select(soup_with_strainer)) == 1000
+    assert len(SEL_ITEM.select(soup_without_strainer)) == 1000
 
 @pytest.mark.asyncio
 async def test_cache_invalidation():
@@ -325,8 +340,8 @@ async def test_cache_invalidation():
     assert soup1 is not soup2
     
     # Verify content is different
-    title1 = soup1.find('meta', property='og:title')['content']
-    title2 = soup2.find('meta', property='og:title')['content']
+    title1 = SEL_TITLE.select_one(soup1)['content']
+    title2 = SEL_TITLE.select_one(soup2)['content']
     assert title1 != title2
 
 @pytest.mark.asyncio
@@ -0,0 +1,43 @@
+"""Test Scrapy middlewares."""
+import re
+import pytest
+from scrapy.http import Request
+
+from bunkrr.core.exceptions import ValidationError
+from bunkrr.scrapy.middlewares import RequestValidator
+
+def test_request_validator_paths():
+    """Test allowed paths are checked through one combined pattern."""
+    validator = RequestValidator(
+        allowed_domains={'bunkr.site'},
+        allowed_paths=[re.compile(r'/a/'), re.compile(r'/v/')]
+    )
+    assert validator.path_pattern is not None
+    
+    validator.validate_request(Request('https://bunkr.site/a/abc123'))
+    validator.validate_request(Request('https://bunkr.site/v/def456'))
+    with pytest.raises(ValidationError):
+        validator.validate_request(Request('https://bunkr.site/f/abc123'))
+    
+    # Patterns that can't be merged are still checked one by one
+    validator = RequestValidator(
+        allowed_domains={'bunkr.site'},
+        allowed_paths=[re.compile(r'/a/'), re.compile(r'/V/', re.IGNORECASE)]
+    )
+    assert validator.path_pattern is None
+    validator.validate_request(Request('https://bunkr.site/v/def456'))
+    
+    # Backreferences keep their own group numbering
+    validator = RequestValidator(
+        allowed_domains={'bunkr.site'},
+        allowed_paths=[re.compile(r'/(a)/'), re.compile(r'/(v)/(\w+)/\2$')]
+    )
+    assert validator.path_pattern is None
+    validator.validate_request(Request('https://bunkr.site/v/abc/abc'))
+    with pytest.raises(ValidationError):
+        validator.validate_request(Request('https://bunkr.site/v/abc/def'))
+    
+    # No allowed paths means any path
+    RequestValidator({'bunkr.site'}).validate_request(
+        Request('https://bunkr.site/f/abc123')
+    )
@@ -0,0 +1,139 @@
+"""Test the Bunkr spider helpers."""
+import pytest
+from collections import deque
+from scrapy.http import HtmlResponse
+
+from bunkrr.core.exceptions import RateLimitError
+from bunkrr.scrapy.spiders import bunkr_spider
+from bunkrr.scrapy.spiders.bunkr_spider import BunkrSpider
+
+ALBUM_HTML = b"""
+<html>
+<head><meta property="og:title" content="Test Album"></head>
+<body>
+    <h1 class="truncate">Test Album</h1>
+    <div class="theItem"><a href="https://bunkr.site/v/abc123">one</a></div>
+    <div class="theItem"><a href="https://bunkr.site/v/def456">two</a></div>
+    <a href="https://bunkr.site/a/other">not media</a>
+</body>
+</html>
+"""
+
+MEDIA_HTML = b"""
+<html>
+<body>
+    <img class="grid-images_box-img" src="https://i-kebab.bunkr.ru/image.jpg">
+    <p class="theSize"> 10 MB </p>
+    <span class="theDate">2024-01-15</span>
+</body>
+</html>
+"""
+
+def make_response(body: bytes) -> HtmlResponse:
+    """Build an HTML response for the spider."""
+    return HtmlResponse(url="https://bunkr.site/a/test", body=body, encoding="utf-8")
+
+@pytest.fixture
+def spider():
+    """Create spider instance."""
+    return BunkrSpider()
+
+def test_extract_media_urls(spider):
+    """Test media URL extraction from album page."""
+    urls = spider._extract_media_urls(make_response(ALBUM_HTML))
+    assert urls == [
+        "https://bunkr.site/v/abc123",
+        "https://bunkr.site/v/def456"
+    ]
+
+def test_extract_media_info(spider):
+    """Test media information extraction."""
+    info = spider._extract_media_info(make_response(MEDIA_HTML))
+    assert info == {
+        'url': "https://i-kebab.bunkr.ru/image.jpg",
+        'type': 'image',
+        'size': "10 MB",
+        'date': "2024-01-15"
+    }
+
+    # Known layout is handled by the regex scan
+    assert spider._match_media_info(make_response(MEDIA_HTML), {})
+
+    # Nothing to extract
+    assert spider._extract_media_info(make_response(b"<html></html>")) is None
+
+def test_extract_from_empty_page(spider):
+    """Test extraction from an empty response body."""
+    response = make_response(b"")
+    assert spider._extract_media_urls(response) == []
+    assert spider._extract_media_info(response) is None
+
+def test_should_retry_circuit_breaker(spider):
+    """Test retries stop once the error threshold is reached."""
+    url = "https://bunkr.site/v/abc123"
+    error = RateLimitError("Too many requests", url=url)
+
+    for _ in range(spider._error_threshold - 1):
+        assert spider._should_retry(url, error)
+    assert not spider._should_retry(url, error)
+
+    # Errors outside the window no longer count
+    spider._last_errors[url] = deque(
+        (t - spider._error_window - 1 for t in spider._last_errors[url]),
+        maxlen=10
+    )
+    assert spider._should_retry(url, error)
+
+def test_extract_media_info_fallback(spider):
+    """Test tree parsing when the fast regex scan misses."""
+    body = MEDIA_HTML.replace(
+        b'<img class="grid-images_box-img" src="https://i-kebab.bunkr.ru/image.jpg">',
+        b'<img src="https://i-kebab.bunkr.ru/image.jpg" class="grid-images_box-img">'
+    )
+    response = make_response(body)
+
+    result = {}
+    assert not spider._match_media_info(response, result)
+    assert result == {}
+
+    info = spider._extract_media_info(response)
+    assert info['url'] == "https://i-kebab.bunkr.ru/image.jpg"
+    assert info['size'] == "10 MB"
+    assert info['date'] == "2024-01-15"
+
+@pytest.mark.parametrize("old, new", [
+    (b'class="grid-images_box-img"', b'class="grid-images_box-img-large"'),
+    (b'class="theSize"', b'class="theSize-label"'),
+    (b'class="theDate"', b'class="old-theDate"')
+])
+def test_match_media_info_whole_class(spider, old, new):
+    """Test the fast scan ignores classes that only contain a token."""
+    response = make_response(MEDIA_HTML.replace(old, new))
+
+    result = {}
+    assert not spider._match_media_info(response, result)
+    assert result == {}
+
+def test_match_media_info_class_list(spider):
+    """Test the fast scan finds tokens inside a class list."""
+    body = (
+        MEDIA_HTML
+        .replace(b'class="grid-images_box-img"', b'class="lazy grid-images_box-img\tshadow"')
+        .replace(b'class="theSize"', b'class="theSize text-xs"')
+        .replace(b'class="theDate"', b'class="muted theDate"')
+    )
+    response = make_response(body)
+
+    result = {}
+    assert spider._match_media_info(response, result)
+    assert result['url'] == "https://i-kebab.bunkr.ru/image.jpg"
+    assert result['size'] == "10 MB"
+    assert result['date'] == "2024-01-15"
+
+def test_html_parser_reused(spider):
+    """Test one lxml parser is kept per response encoding."""
+    spider._extract_media_urls(make_response(ALBUM_HTML))
+    parser = bunkr_spider._HTML_PARSERS['utf-8']
+
+    spider._extract_media_urls(make_response(ALBUM_HTML))
+    assert bunkr_spider._HTML_PARSERS['utf-8'] is parser
@@ -0,0 +1,29 @@
+"""Test progress tracking."""
+import pytest
+
+from bunkrr.ui.progress import ProgressTracker
+
+@pytest.fixture
+def tracker():
+    """Provide the progress tracker with a clean layout cache."""
+    tracker = ProgressTracker()
+    tracker._last_layout = None
+    tracker._layout_failed = False
+    return tracker
+
+def test_render_layout_keeps_last_good(tracker, monkeypatch):
+    """Test a failing layout build falls back to the previous layout."""
+    layout = tracker._render_layout()
+    assert layout is tracker._last_layout
+    
+    def broken():
+        raise ValueError("bad stats")
+    
+    monkeypatch.setattr(tracker, "_generate_layout", broken)
+    assert tracker._render_layout() is layout
+    assert tracker._layout_failed
+    
+    # Recovers once the layout builds again
+    monkeypatch.undo()
+    assert tracker._render_layout() is not layout
+    assert not tracker._layout_failed
@@ -9,6 +9,7 @@ from bunkrr.utils.caching import (
     SQLiteCache
 )
 
+@pytest.mark.slow
 def test_memory_cache():
     """Test memory cache implementation."""
     cache = MemoryCache("test", ttl=1)
@@ -38,6 +39,7 @@ def test_memory_cache():
     cache.clear()
     assert cache.get("key3") is None
 
+@pytest.mark.slow
 def test_file_cache(tmp_path):
     """Test file cache implementation."""
     cache_dir = tmp_path / "cache"
@@ -73,6 +75,7 @@ def test_file_cache(tmp_path):
     cache.set("complex", data)
     assert cache.get("complex") == data
 
+@pytest.mark.slow
 def test_sqlite_cache(tmp_path):
     """Test SQLite cache implementation."""
     db_path = tmp_path / "cache.db"
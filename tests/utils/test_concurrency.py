@@ -85,6 +85,7 @@ async def test_thread_pool():
         ])
         assert results == [0, 2, 4]
 
+@pytest.mark.slow
 @pytest.mark.asyncio
 async def test_wait_for_with_token():
     """Test wait_for with cancellation token."""
@@ -0,0 +1,92 @@
+"""Test core utilities."""
+import asyncio
+import gc
+import pytest
+from unittest.mock import Mock
+
+from bunkrr.core.exceptions import BunkrrError, ValidationError
+from bunkrr.utils.core import (
+    CancellationToken, run_in_executor, validate_path,
+    wait_for_with_token
+)
+
+@pytest.mark.asyncio
+async def test_run_in_executor():
+    """Test running a function in the shared thread pool."""
+    async with run_in_executor(lambda x: x * 2, 21) as result:
+        assert result == 42
+
+@pytest.mark.slow
+@pytest.mark.asyncio
+async def test_wait_for_with_token():
+    """Test waiting with a timeout and cancellation token."""
+    async def slow_task():
+        await asyncio.sleep(0.2)
+        return "done"
+    
+    token = CancellationToken()
+    assert await wait_for_with_token(slow_task, timeout=1, cancellation_token=token) == "done"
+    
+    with pytest.raises(BunkrrError, match="timeout"):
+        await wait_for_with_token(slow_task, timeout=0.05, cancellation_token=token)
+    
+    # Cancelling mid-wait aborts the task
+    asyncio.get_running_loop().call_later(0.05, token.cancel)
+    with pytest.raises(BunkrrError, match="cancelled"):
+        await wait_for_with_token(slow_task, timeout=1, cancellation_token=token)
+    
+    # Already cancelled tokens fail fast
+    with pytest.raises(BunkrrError, match="cancelled"):
+        await wait_for_with_token(slow_task, timeout=1, cancellation_token=token)
+
+@pytest.mark.asyncio
+async def test_cancellation_token():
+    """Test cancellation token callbacks and waiting."""
+    token = CancellationToken()
+    callback = Mock()
+    assert not token.is_cancelled
+    
+    token.add_callback(callback)
+    waiter = asyncio.create_task(token.wait())
+    await asyncio.sleep(0)
+    assert not waiter.done()
+    
+    token.cancel()
+    callback.assert_called_once()
+    await asyncio.wait_for(waiter, timeout=1)
+    assert token.is_cancelled
+    
+    # Second cancel is a no-op
+    token.cancel()
+    callback.assert_called_once()
+    
+    assert not token._callbacks
+    
+    # Bound methods and inline lambdas stay registered until cancel
+    class Operation:
+        stopped = False
+        
+        def stop(self):
+            self.stopped = True
+    
+    token = CancellationToken()
+    operation = Operation()
+    fired = []
+    token.add_callback(operation.stop)
+    token.add_callback(lambda: fired.append(True))
+    gc.collect()
+    token.cancel()
+    assert operation.stopped
+    assert fired == [True]
+
+def test_validate_path(tmp_path, readonly_dir):
+    """Test path validation creates directories and rejects read-only ones."""
+    new_dir = tmp_path / "downloads"
+    assert validate_path(new_dir, create=True) == new_dir
+    assert new_dir.is_dir()
+    
+    with pytest.raises(ValidationError):
+        validate_path(tmp_path / "missing", must_exist=True)
+    
+    with pytest.raises(ValidationError):
+        validate_path(readonly_dir)
@@ -0,0 +1,105 @@
+"""Test data utilities."""
+import pytest
+
+from bunkrr.utils import data
+from bunkrr.utils.data import (
+    DownloadStats, RateTracker, format_size, get_media_type
+)
+
+def test_format_size():
+    """Test size formatting."""
+    assert format_size(0) == "0 B"
+    assert format_size(512) == "512.00 B"
+    assert format_size(1023) == "1023.00 B"
+    assert format_size(1024) == "1.00 KB"
+    assert format_size(1536) == "1.50 KB"
+    assert format_size(1024 ** 2 - 1) == "1024.00 KB"
+    assert format_size(1024 ** 3 * 2.5) == "2.50 GB"
+    assert format_size(1024 ** 6) == "1024.00 PB"
+    
+    with pytest.raises(ValueError):
+        format_size(-1)
+
+@pytest.mark.parametrize("filename,expected", [
+    ("photo.jpg", "image"),
+    ("photo.JPEG", "image"),
+    ("photo.png", "image"),
+    ("photo.gif", "image"),
+    ("clip.mp4", "video"),
+    ("clip.webm", "video"),
+    ("archive.zip", "application"),
+    ("backup.tar.gz", "application"),
+    ("backup.tgz", "application"),
+    ("https://cdn.bunkr.ru/clip.MOV", "video"),
+    ("notes.txt", None),
+    ("photo.jpg.txt", None),
+    ("no_extension", None),
+    ("", None),
+])
+def test_get_media_type(filename, expected):
+    """Test media type detection from filenames."""
+    assert get_media_type(filename) == expected
+
+def test_get_media_type_cached():
+    """Test media types are memoized per file suffix."""
+    data._media_type_for_suffix.cache_clear()
+    
+    assert get_media_type("first.mp4") == "video"
+    assert get_media_type("second.mp4") == "video"
+    
+    info = data._media_type_for_suffix.cache_info()
+    assert info.misses == 1
+    assert info.hits == 1
+
+def test_rate_tracker(monkeypatch):
+    """Test the running event total follows the sliding window."""
+    now = 1000.0
+    monkeypatch.setattr(data.time, "time", lambda: now)
+    tracker = RateTracker(window_size=10)
+    
+    tracker.add_event(4)
+    now += 2
+    tracker.add_event(2)
+    now += 2
+    assert tracker.get_rate() == 6 / 4
+    
+    # The first event leaves the window
+    now += 7
+    assert tracker.get_rate() == 2 / 9
+    assert tracker._event_total == 2
+    
+    now += 10
+    assert tracker.get_rate() == 0.0
+    assert tracker._event_total == 0
+    
+    tracker.add_event(3)
+    tracker.reset()
+    assert tracker._event_total == 0
+
+def test_download_stats_to_dict(monkeypatch):
+    """Test stats export reads every reported field."""
+    monkeypatch.setattr(data.time, "time", lambda: 1010.0)
+    stats = DownloadStats(total=4, completed=3, failed=1, bytes_downloaded=2048)
+    stats.start_time = 1000.0
+    stats.add_error("timeout")
+    
+    result = stats.to_dict()
+    assert type(result['errors']) is dict
+    assert result == {
+        'total': 4,
+        'completed': 3,
+        'failed': 1,
+        'skipped': 0,
+        'bytes_downloaded': 2048,
+        'elapsed_time': 10.0,
+        'success_rate': 75.0,
+        'average_speed': 204.8,
+        'errors': {'timeout': 1}
+    }
+    
+    # The exported errors are a copy
+    result['errors']['timeout'] = 5
+    assert stats.errors == {'timeout': 1}
+    
+    # Slotted instances carry no per-instance __dict__
+    assert not hasattr(stats, '__dict__')
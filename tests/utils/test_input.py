@@ -41,7 +41,7 @@ def test_parse_urls():
     assert parse_urls("") == []
     assert parse_urls("   ") == []
 
-def test_parse_path(tmp_path):
+def test_parse_path(tmp_path, readonly_dir):
     """Test path parsing."""
     # Test valid path
     path = parse_path(str(tmp_path))
@@ -59,10 +59,6 @@ def test_parse_path(tmp_path):
         parse_path(str(tmp_path / "nonexistent"), must_exist=True)
     
     # Test non-writable path
-    readonly_dir = tmp_path / "readonly"
-    readonly_dir.mkdir()
-    readonly_dir.chmod(0o444)  # Read-only
-    
     with pytest.raises(ValidationError):
         parse_path(str(readonly_dir / "test"))
     
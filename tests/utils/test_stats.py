@@ -1,16 +1,28 @@
 """Test statistics utilities."""
-import time
 import asyncio
 import pytest
 from datetime import datetime, timedelta
+from types import SimpleNamespace
 
+from bunkrr.utils import stats as stats_module
 from bunkrr.utils.stats import (
     DownloadStats,
     RateTracker,
     ProgressTracker
 )
 
-def test_download_stats():
+@pytest.fixture
+def fake_clock(monkeypatch):
+    """Advance the stats module clock by hand instead of sleeping."""
+    now = [1000.0]  # Non-zero, since a zero start time reads as unset
+    monkeypatch.setattr(
+        stats_module,
+        "time",
+        SimpleNamespace(time=lambda: now[0], monotonic=lambda: now[0])
+    )
+    return now
+
+def test_download_stats(fake_clock):
     """Test download statistics tracking."""
     stats = DownloadStats()
     
@@ -29,13 +41,13 @@ def test_download_stats():
     assert stats.start_time is not None
     assert stats.is_running
     
-    time.sleep(0.1)  # Small delay
+    fake_clock[0] += 0.1
     stats.stop()
     assert stats.end_time is not None
     assert not stats.is_running
     
     # Test elapsed time
-    assert stats.elapsed_time > 0
+    assert stats.elapsed_time == pytest.approx(0.1)
     
     # Test success rate
     stats.total = 100
@@ -59,7 +71,7 @@ def test_download_stats():
     assert data["success_rate"] == 75.0
     assert data["errors"] == {"test_error": 2}
 
-def test_rate_tracker():
+def test_rate_tracker(fake_clock):
     """Test rate tracking."""
     tracker = RateTracker(window_size=1)  # 1 second window
     
@@ -68,6 +80,7 @@ def test_rate_tracker():
     
     # Test event tracking
     tracker.add_event(1)
+    fake_clock[0] += 0.5
     assert tracker.get_rate() > 0
     
     # Test wait time tracking
@@ -78,7 +91,7 @@ def test_rate_tracker():
     assert stats["rate_limit_hits"] == 1
     
     # Test window cleanup
-    time.sleep(1.1)  # Wait for window to expire
+    fake_clock[0] += 1.1  # Move past the window
     assert tracker.get_rate() == 0.0
     
     # Test reset
@@ -87,7 +100,7 @@ def test_rate_tracker():
     assert tracker.get_rate() == 0.0
     assert tracker.get_wait_time_stats()["rate_limit_hits"] == 0
 
-def test_progress_tracker():
+def test_progress_tracker(fake_clock):
     """Test progress tracking."""
     tracker = ProgressTracker()
     
@@ -113,6 +126,7 @@ def test_progress_tracker():
     assert tracker.stats.skipped == 1
     
     # Test rate tracking
+    fake_clock[0] += 0.1
     assert tracker.rate_tracker.get_rate() > 0
     
     # Test stop
@@ -129,7 +143,7 @@ def test_progress_tracker():
     assert stats["errors"] == {"test_error": 1}
 
 @pytest.mark.asyncio
-async def test_progress_tracker_async():
+async def test_progress_tracker_async(fake_clock):
     """Test progress tracker in async context."""
     tracker = ProgressTracker()
     tracker.start()
@@ -137,7 +151,8 @@ async def test_progress_tracker_async():
     # Simulate async updates
     for _ in range(5):
         tracker.update(completed=1, bytes_downloaded=1024)
-        await asyncio.sleep(0.1)
+        fake_clock[0] += 0.1
+        await asyncio.sleep(0)  # Yield without waiting
     
     tracker.stop()
     
@@ -0,0 +1,386 @@
+"""Test storage utilities."""
+import asyncio
+import os
+import pickle
+import threading
+import zlib
+import pytest
+from collections import Counter, OrderedDict
+
+from bunkrr.core.exceptions import FileSystemError
+from bunkrr.utils import storage
+from bunkrr.utils.storage import (
+    CacheConfig, CacheEntry, FileCache, MemoryCache, SQLiteCache,
+    ThreadedFile, ensure_directory, get_unique_path, is_valid_path, safe_remove,
+    sanitize_filename, write_chunks
+)
+
+@pytest.mark.parametrize("use_writev", [True, False])
+def test_write_chunks(tmp_path, monkeypatch, use_writev):
+    """Test gathered chunk writes with and without writev."""
+    monkeypatch.setattr(storage, "_HAS_WRITEV", use_writev)
+    test_file = tmp_path / "chunks.bin"
+
+    # Mix of empty, small and large chunks, more than one writev batch
+    chunks = [b"", b"a", b"b" * 8192, b"c" * 3000] * 400
+
+    fd = os.open(test_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        written = write_chunks(fd, chunks)
+    finally:
+        os.close(fd)
+
+    assert written == sum(len(chunk) for chunk in chunks)
+    assert test_file.read_bytes() == b"".join(chunks)
+
+    # Empty input writes nothing
+    fd = os.open(test_file, os.O_WRONLY | os.O_TRUNC)
+    try:
+        assert write_chunks(fd, []) == 0
+    finally:
+        os.close(fd)
+    assert test_file.read_bytes() == b""
+
+@pytest.mark.asyncio
+async def test_threaded_file(tmp_path):
+    """Test writing batches through worker threads."""
+    test_file = tmp_path / "out.bin"
+    output = ThreadedFile(test_file)
+    await output.open()
+    await output.write([b"abc", b"def"])
+    await output.write([b"ghi"])
+    await output.close()
+
+    assert test_file.read_bytes() == b"abcdefghi"
+
+@pytest.mark.slow
+@pytest.mark.asyncio
+async def test_threaded_file_cancel_during_write(tmp_path, monkeypatch):
+    """Test close waits for a write that outlives its cancelled caller."""
+    started = threading.Event()
+    release = threading.Event()
+
+    def slow_write(fd, chunks):
+        started.set()
+        release.wait(5)
+        write_chunks(fd, chunks)
+
+    monkeypatch.setattr(storage, "write_chunks", slow_write)
+
+    test_file = tmp_path / "out.bin"
+    output = ThreadedFile(test_file)
+    await output.open()
+
+    writer = asyncio.create_task(output.write([b"data"]))
+    await asyncio.to_thread(started.wait, 5)
+    writer.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await writer
+
+    closer = asyncio.create_task(output.close())
+    await asyncio.sleep(0.05)
+    assert not closer.done()
+
+    release.set()
+    await closer
+    assert test_file.read_bytes() == b"data"
+
+@pytest.mark.asyncio
+async def test_threaded_file_cancel_during_open(tmp_path, monkeypatch):
+    """Test a cancelled open still has its descriptor closed."""
+    release = threading.Event()
+    opened = []
+    real_open = os.open
+
+    def slow_open(*args):
+        release.wait(5)
+        fd = real_open(*args)
+        opened.append(fd)
+        return fd
+
+    monkeypatch.setattr(storage.os, "open", slow_open)
+
+    output = ThreadedFile(tmp_path / "out.bin")
+    opener = asyncio.create_task(output.open())
+    await asyncio.sleep(0)
+    opener.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await opener
+
+    release.set()
+    await output.close()
+
+    assert len(opened) == 1
+    with pytest.raises(OSError):
+        os.fstat(opened[0])
+
+def test_safe_remove(tmp_path):
+    """Test file removal without an existence pre-check."""
+    test_file = tmp_path / "test.txt"
+    test_file.write_text("test")
+
+    safe_remove(test_file)
+    assert not test_file.exists()
+
+    # Missing file is not an error
+    safe_remove(test_file)
+
+def test_cache_entry_size():
+    """Test cache entry size calculation."""
+    page = b"<html>" + b"x" * 100000 + b"</html>"
+    assert CacheEntry(page).size == len(page)
+    assert CacheEntry("text").size == 4
+
+    class Response:
+        body = page
+
+    assert CacheEntry(Response()).size == len(page)
+
+    # Other values fall back to their pickled size
+    assert CacheEntry({'a': 1}).size > 0
+
+def test_sqlite_cache(tmp_path):
+    """Test SQLite cache operations and its in-memory key index."""
+    config = CacheConfig(name="test", ttl=60, db_path=tmp_path / "cache.db")
+    cache = SQLiteCache(config)
+    
+    cache.set("key", {"a": 1})
+    assert cache.has("key")
+    assert cache.get("key") == {"a": 1}
+    assert not cache.has("missing")
+    assert cache.get("missing") is None
+    
+    with cache._get_connection() as conn:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    
+    # The index is rebuilt from the table on reopen
+    reopened = SQLiteCache(config)
+    assert reopened.get("key") == {"a": 1}
+    
+    # Expired rows are dropped
+    cache._timestamps["key"] -= 120
+    assert not cache.has("key")
+    assert cache.get("key") is None
+    
+    cache.set("other", "value")
+    cache.clear()
+    assert not cache.has("other")
+    assert cache.get_size() == 0
+
+def test_sqlite_cache_shared(tmp_path):
+    """Test rows written by another instance are visible."""
+    config = CacheConfig(name="test", ttl=60, db_path=tmp_path / "cache.db")
+    first = SQLiteCache(config)
+    second = SQLiteCache(config)
+    
+    first.set("key", "value")
+    assert second.has("key")
+    assert second.get("key") == "value"
+    assert "key" in second._timestamps
+    
+    # Rows removed elsewhere drop out of the index on read
+    first.delete("key")
+    assert second.get("key") is None
+    assert "key" not in second._timestamps
+    assert not second.has("key")
+
+def test_sqlite_cache_namespaces(tmp_path):
+    """Test caches sharing a database keep separate tables."""
+    db_path = tmp_path / "cache.db"
+    first = SQLiteCache(CacheConfig(name="pages", db_path=db_path))
+    second = SQLiteCache(CacheConfig(name="media-info", db_path=db_path))
+    
+    first.set("key", "page")
+    second.set("key", "info")
+    assert first.get("key") == "page"
+    assert second.get("key") == "info"
+    
+    second.clear()
+    assert first.get("key") == "page"
+    assert second.get("key") is None
+
+def test_memory_cache_ttl(monkeypatch):
+    """Test memory cache expiry through the expiry heap."""
+    now = 1000.0
+    monkeypatch.setattr(storage.time, "time", lambda: now)
+    cache = MemoryCache(CacheConfig(name="test", ttl=60))
+    
+    cache.set("old", "a")
+    now += 30
+    cache.set("new", "b")
+    cache.set("old", "c")  # Re-set restarts the TTL
+    assert cache.get("old") == "c"
+    assert cache.get_size() == 2
+    
+    now += 45
+    assert cache.has("old")
+    assert cache.has("new")
+    
+    now += 20
+    assert not cache.has("old")
+    assert cache.get("new") is None
+    assert cache.get_size() == 0
+    assert not cache._expiry_heap
+
+def test_memory_cache_heap_bounded():
+    """Test stale expiry entries don't accumulate under repeated sets."""
+    cache = MemoryCache(CacheConfig(name="test", ttl=3600))
+    
+    for i in range(10000):
+        cache.set("key", i)
+    assert len(cache._expiry_heap) <= 2 * len(cache._cache) + 16
+    
+    for i in range(1000):
+        cache.set(f"key{i}", i)
+        cache.delete(f"key{i}")
+    assert len(cache._expiry_heap) <= 2 * len(cache._cache) + 16
+    assert cache.get("key") == 9999
+
+def test_file_cache(tmp_path):
+    """Test file cache round trips complex values."""
+    cache = FileCache(CacheConfig(name="test", cache_dir=tmp_path))
+    value = {"album": "test", "files": [{"name": "a.jpg", "size": 1024}]}
+    
+    cache.set("key", value)
+    assert cache.get("key") == value
+    assert cache.has("key")
+    assert cache.get_size() == (tmp_path / "test" / "key.cache").stat().st_size
+    assert not list((tmp_path / "test").glob("*.tmp"))
+    
+    # Values JSON can't represent exactly still round trip
+    cache.set("tuple", (1, 2))
+    assert cache.get("tuple") == (1, 2)
+    
+    cache.delete("key")
+    assert cache.get("key") is None
+
+def test_file_cache_eviction(tmp_path):
+    """Test the oldest files are evicted once the size limit is hit."""
+    cache = FileCache(CacheConfig(
+        name="test", cache_dir=tmp_path, max_size=250, compress=False
+    ))
+    cache_dir = tmp_path / "test"
+    
+    for i, key in enumerate(("a", "b", "c")):
+        cache.set(key, "x" * 100)
+        os.utime(cache_dir / f"{key}.cache", (1000 + i, 1000 + i))
+    
+    assert cache.get("a") is None
+    assert cache.get("b") == "x" * 100
+    assert cache.get("c") == "x" * 100
+    assert cache.get_size() == sum(
+        p.stat().st_size for p in cache_dir.glob("*.cache")
+    )
+    
+    # The size is rebuilt from the directory on reopen
+    reopened = FileCache(CacheConfig(name="test", cache_dir=tmp_path))
+    assert reopened.get_size() == cache.get_size()
+
+def test_cache_entry_orjson():
+    """Test JSON-compatible entries are stored with orjson."""
+    pytest.importorskip("orjson")
+    entry = CacheEntry({"a": [1, 2]}, timestamp=1000.0)
+    
+    data = entry.to_bytes(compress=False)
+    assert data[:1] == storage._ORJSON_HEADER
+    restored = CacheEntry.from_bytes(data, compress=False)
+    assert (restored.value, restored.timestamp) == ({"a": [1, 2]}, 1000.0)
+    
+    # Builtin subclasses keep their type through pickle
+    for value in (Counter(a=2), OrderedDict(a=1), {"nested": Counter(b=1)}):
+        data = CacheEntry(value).to_bytes()
+        assert zlib.decompress(data)[:1] != storage._ORJSON_HEADER
+        restored = CacheEntry.from_bytes(data).value
+        assert restored == value
+        assert type(restored) is type(value)
+    assert type(CacheEntry.from_bytes(
+        CacheEntry({"nested": Counter(b=1)}).to_bytes()
+    ).value["nested"]) is Counter
+    
+    # Entries written as pickles are still readable
+    legacy = CacheEntry.from_bytes(
+        zlib.compress(pickle.dumps(({"a": 1}, 1000.0)))
+    )
+    assert legacy.value == {"a": 1}
+
+@pytest.mark.parametrize("filename,expected", [
+    ("photo.jpg", "photo.jpg"),
+    ("../../etc/passwd", "etcpasswd"),
+    ('bad<>:"/\\|?*name.mp4', "badname.mp4"),
+    ("  .hidden file. ", "hidden file"),
+    ("caf\u00e9 \u5199\u771f.png", "caf\u00e9 \u5199\u771f.png"),
+    ("!!!", "unnamed"),
+    ("a" * 300, "a" * 255),
+])
+def test_sanitize_filename(filename, expected):
+    """Test filename sanitization."""
+    assert sanitize_filename(filename) == expected
+
+def test_get_unique_path(tmp_path):
+    """Test numbered paths skip existing files."""
+    test_path = tmp_path / "test.txt"
+    assert get_unique_path(test_path) == test_path
+    
+    test_path.write_text("test")
+    for counter in (1, 2, 4):
+        (tmp_path / f"test_{counter}.txt").write_text("test")
+    assert get_unique_path(test_path) == tmp_path / "test_3.txt"
+    
+    # Directories are numbered the same way
+    test_dir = tmp_path / "album"
+    test_dir.mkdir()
+    assert get_unique_path(test_dir) == tmp_path / "album_1"
+
+def test_is_valid_path(tmp_path):
+    """Test writability checks for files, directories and new paths."""
+    test_file = tmp_path / "test.txt"
+    test_file.write_text("test")
+    
+    assert is_valid_path(test_file)
+    assert test_file.read_text() == "test"
+    assert is_valid_path(tmp_path)
+    assert is_valid_path(tmp_path / "new.txt")
+    assert not is_valid_path(tmp_path / "missing" / "new.txt")
+    
+    # Probe files are cleaned up
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["test.txt"]
+
+def test_is_valid_path_readonly(readonly_dir):
+    """Test read-only directories are not writable."""
+    assert not is_valid_path(readonly_dir)
+    assert not is_valid_path(readonly_dir / "new.txt")
+
+def test_is_valid_path_probe_not_removed(tmp_path, monkeypatch):
+    """Test a probe that can be created but not deleted is not writable."""
+    def deny_unlink(path):
+        raise PermissionError(path)
+
+    monkeypatch.setattr(storage.os, "unlink", deny_unlink)
+    assert not is_valid_path(tmp_path)
+
+def test_ensure_directory(tmp_path, monkeypatch):
+    """Test directories are created and writability is checked once."""
+    nested = tmp_path / "album" / "nested"
+    ensure_directory(nested)
+    assert nested.is_dir()
+    
+    # Known directories skip the permission check
+    checks = []
+    real_access = os.access
+    monkeypatch.setattr(
+        storage.os, "access",
+        lambda *args: checks.append(args) or real_access(*args)
+    )
+    ensure_directory(nested)
+    assert checks == []
+    
+    # Removed directories are recreated
+    nested.rmdir()
+    ensure_directory(nested)
+    assert nested.is_dir()
+    
+    # Existing files can't become directories
+    test_file = tmp_path / "file.txt"
+    test_file.write_text("test")
+    with pytest.raises(FileSystemError):
+        ensure_directory(test_file)
@@ -67,7 +67,7 @@ def test_validate_urls():
     with pytest.raises(ValidationError):
         validator.validate_urls(invalid_urls)
 
-def test_validate_download_path(tmp_path):
+def test_validate_download_path(tmp_path, readonly_dir):
     """Test download path validation."""
     # Test valid path
     valid_path = tmp_path / "downloads"
@@ -77,13 +77,9 @@ def test_validate_download_path(tmp_path):
     with pytest.raises(ValidationError):
         validate_download_path(None)
     
-    # Test non-writable path (simulate by creating readonly dir)
-    readonly_path = tmp_path / "readonly"
-    readonly_path.mkdir()
-    readonly_path.chmod(0o444)  # Read-only
-    
+    # Test non-writable path
     with pytest.raises(ValidationError):
-        validate_download_path(readonly_path)
+        validate_download_path(readonly_dir)
 
 def test_validate_config_value():
     """Test configuration value validation."""